@@ -1,45 +1,239 @@
 import os
+import re
+import csv
+import bisect
+import math
+import gzip
+import zlib
+import mimetypes
 import secrets
+import sqlite3
+import stat
+import tempfile
+import uuid
 import io
 import json
+import hashlib
+import importlib
 import textwrap
+import threading
+import contextvars
+import time
+import zipfile
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
+from contextlib import contextmanager
 from functools import wraps
 
-from flask import Flask, render_template, request, redirect, url_for, flash, send_file, abort, session
-import qrcode
-import firebase_admin
-from firebase_admin import credentials, firestore
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.utils import ImageReader
-
-# Initialize Firebase
-if not firebase_admin._apps:
-    # Try to get credentials from environment variable first (for Vercel)
-    # Use FIREBASE_CREDENTIALS instead of GOOGLE_APPLICATION_CREDENTIALS to avoid conflicts
-    cred_json = os.environ.get('FIREBASE_CREDENTIALS')
-    
-    if cred_json:
-        # Environment variable contains JSON string
-        try:
-            cred_dict = json.loads(cred_json)
-            cred = credentials.Certificate(cred_dict)
+from flask import Flask, render_template, request, redirect, url_for, flash, send_file, abort, session, jsonify, Response, g
+from flask import before_render_template, template_rendered, send_from_directory
+from jinja2 import FileSystemBytecodeCache
+from werkzeug.middleware.proxy_fix import ProxyFix
+import click
+
+# Heavy dependencies (Firebase, ReportLab, qrcode/PIL) are loaded on first use
+# so a serverless cold start only pays for what the request needs.
+class LazyModule:
+    """Module proxy that imports the real module on first attribute access"""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+firestore = LazyModule("firebase_admin.firestore")
+
+class PerProcess:
+    """Lazily built resource that is rebuilt in a forked child, or once ``alive`` reports it dead"""
+
+    def __init__(self, factory, alive=None):
+        self._factory = factory
+        self._alive = alive or (lambda value: True)
+        self._value = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def peek(self):
+        """The instance owned by this process, without building one"""
+        return self._value if self._pid == os.getpid() else None
+
+    def get(self):
+        # Threads and process pools do not survive a fork, so track the owning process
+        with self._lock:
+            if self._value is None or self._pid != os.getpid() or not self._alive(self._value):
+                self._value = self._factory()
+                self._pid = os.getpid()
+            return self._value
+
+    def reset(self, value):
+        """Drop value so the next get() builds a fresh one"""
+        with self._lock:
+            if self._value is value:
+                self._value = None
+
+def _init_firestore():
+    import firebase_admin
+    from firebase_admin import credentials
+
+    # Initialize Firebase
+    if not firebase_admin._apps:
+        # Try to get credentials from environment variable first (for Vercel)
+        # Use FIREBASE_CREDENTIALS instead of GOOGLE_APPLICATION_CREDENTIALS to avoid conflicts
+        cred_json = os.environ.get('FIREBASE_CREDENTIALS')
+        
+        if cred_json:
+            # Environment variable contains JSON string
+            try:
+                cred_dict = json.loads(cred_json)
+                cred = credentials.Certificate(cred_dict)
+                firebase_admin.initialize_app(cred)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid FIREBASE_CREDENTIALS JSON: {str(e)}")
+        elif os.path.exists('firebase-credentials.json'):
+            # Local development - use file
+            cred = credentials.Certificate('firebase-credentials.json')
             firebase_admin.initialize_app(cred)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid FIREBASE_CREDENTIALS JSON: {str(e)}")
-    elif os.path.exists('firebase-credentials.json'):
-        # Local development - use file
-        cred = credentials.Certificate('firebase-credentials.json')
-        firebase_admin.initialize_app(cred)
-    else:
-        raise ValueError("Firebase credentials not found. Set FIREBASE_CREDENTIALS environment variable or add firebase-credentials.json")
+        else:
+            raise ValueError("Firebase credentials not found. Set FIREBASE_CREDENTIALS environment variable or add firebase-credentials.json")
+    
+    return firestore.client()
+
+_db_client = None
+_db_lock = threading.Lock()
+
+def get_db():
+    """Firestore client, created on first database access"""
+    global _db_client
+    if _db_client is None:
+        with _db_lock:
+            if _db_client is None:
+                _db_client = _init_firestore()
+    return _db_client
+
+def set_db(client):
+    """Use another Firestore-compatible client (e.g. the in-memory fake in benchmarks/)"""
+    global _db_client
+    with _db_lock:
+        _db_client = client
+
+# Per-request timing spans, collected for Server-Timing and /admin/metrics
+class RequestTimings:
+    """Span name -> [count, seconds] for the current request"""
+
+    def __init__(self):
+        self.spans = {}
+        self.template_start = None
+        self._lock = threading.Lock()
+
+    def add(self, name, seconds):
+        with self._lock:
+            entry = self.spans.setdefault(name, [0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+
+_request_timings = contextvars.ContextVar("request_timings", default=None)
 
-db = firestore.client()
+def record_span(name, seconds):
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.add(name, seconds)
+
+@contextmanager
+def span(name):
+    """Time a block of work as one span of the current request"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_span(name, time.perf_counter() - start)
+
+class _TracedFirestore:
+    """Proxy over Firestore clients, queries and references that records a
+    db-<collection> span for every call that reaches the network"""
+
+    CHAINED = {
+        'collection', 'document', 'where', 'order_by', 'limit', 'limit_to_last', 'offset',
+        'select', 'start_at', 'start_after', 'end_at', 'end_before', 'count', 'sum', 'avg', 'batch',
+    }
+    TERMINAL = {'get', 'add', 'set', 'create', 'update', 'delete', 'commit'}
+
+    def __init__(self, target, label):
+        self._target = target
+        self._label = label
+
+    def __getattr__(self, attr):
+        value = getattr(self._target, attr)
+        if attr not in self.CHAINED and attr not in self.TERMINAL and attr != 'stream':
+            return value
+        def call(*args, **kwargs):
+            args = [a._target if isinstance(a, _TracedFirestore) else a for a in args]
+            if attr in self.CHAINED:
+                label = args[0] if attr == 'collection' and args else ('batch' if attr == 'batch' else self._label)
+                return _TracedFirestore(value(*args, **kwargs), label)
+            if attr == 'stream':
+                return _timed_stream(value(*args, **kwargs), f"db-{self._label}")
+            if self._label == 'batch' and attr != 'commit':
+                # Batched writes are only queued locally; commit is the one RPC
+                return value(*args, **kwargs)
+            with span(f"db-{self._label}"):
+                return value(*args, **kwargs)
+        return call
+
+def _timed_stream(iterator, name):
+    # Only time spent fetching counts, not time the caller spends per document
+    elapsed = 0.0
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                elapsed += time.perf_counter() - start
+            yield item
+    finally:
+        record_span(name, elapsed)
+
+class _LazyClient:
+    """Stands in for the Firestore client until something touches it"""
+
+    def __getattr__(self, attr):
+        return getattr(_TracedFirestore(get_db(), None), attr)
+
+db = _LazyClient()
 
 app = Flask(__name__)
 app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY", "dev-secret-change-me")
 
+# Only X-Forwarded-For entries appended by our own proxies are trusted
+# (Vercel's edge is one hop; use 0 when clients connect directly)
+TRUSTED_PROXY_HOPS = int(os.environ.get("TRUSTED_PROXY_HOPS", "1"))
+if TRUSTED_PROXY_HOPS:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=TRUSTED_PROXY_HOPS)
+
+# Compiled templates are kept on disk so fresh workers skip parsing;
+# /tmp is the only writable path on Vercel
+def _private_dir(path):
+    """Create path as a 0700 directory and refuse one that another user owns"""
+    # Bytecode is loaded with marshal, so a planted cache file would be executed
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or (hasattr(os, "getuid") and info.st_uid != os.getuid()):
+        raise RuntimeError(f"{path} is not a directory owned by the current user")
+    if info.st_mode & 0o077:
+        os.chmod(path, 0o700)
+    return path
+
+# Without JINJA_CACHE_DIR, Jinja picks its own per-user 0700 directory
+JINJA_CACHE_DIR = os.environ.get("JINJA_CACHE_DIR")
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(_private_dir(JINJA_CACHE_DIR) if JINJA_CACHE_DIR else None)
+
 ADMIN_USERNAME = os.environ.get("ADMIN_USERNAME", "admin")
 ADMIN_PASSWORD = os.environ.get("ADMIN_PASSWORD", "admin123")
 
@@ -62,6 +256,224 @@ def add_cache_headers(response):
     return response
 CONTACT_FASTWORK = "https://fastwork.id/user/glh_prima"
 
+# On-the-fly compression of dynamic text responses
+COMPRESS_MIN_SIZE = int(os.environ.get("COMPRESS_MIN_SIZE", "1024"))
+COMPRESS_GZIP_LEVEL = int(os.environ.get("COMPRESS_GZIP_LEVEL", "6"))
+COMPRESS_BROTLI_QUALITY = int(os.environ.get("COMPRESS_BROTLI_QUALITY", "5"))
+COMPRESSIBLE_MIMETYPES = {
+    "text/html", "text/plain", "text/css", "text/csv", "text/javascript",
+    "application/javascript", "application/json", "application/x-ndjson", "image/svg+xml",
+}
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+def _compressed_chunks(chunks, encoding):
+    """Compress an iterable of byte chunks incrementally, never holding the whole body"""
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=COMPRESS_BROTLI_QUALITY)
+        compress, finish = compressor.process, compressor.finish
+    else:
+        compressor = zlib.compressobj(COMPRESS_GZIP_LEVEL, zlib.DEFLATED, 31)
+        compress, finish = compressor.compress, compressor.flush
+    for chunk in chunks:
+        data = compress(chunk)
+        if data:
+            yield data
+    yield finish()
+
+@app.after_request
+def compress_response(response):
+    """gzip/brotli for text responses; files, images, PDFs and encoded bodies pass through"""
+    if (
+        request.method == "HEAD"
+        or response.status_code < 200 or response.status_code in (204, 206, 304)
+        or response.direct_passthrough
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+    ):
+        return response
+    # Buffered bodies below the threshold are not worth it; streams have no known size
+    if not response.is_streamed and (response.content_length or 0) < COMPRESS_MIN_SIZE:
+        return response
+    encoding = request.accept_encodings.best_match(["br", "gzip"] if brotli else ["gzip"])
+    response.vary.add("Accept-Encoding")
+    if not encoding:
+        return response
+
+    response.response = _compressed_chunks(response.iter_encoded(), encoding)
+    response.headers.pop("Content-Length", None)
+    response.headers["Content-Encoding"] = encoding
+    # The compressed body is a different representation of the same content
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+# Fingerprinted static assets written by `flask build-assets`
+ASSET_DIST_DIR = "dist"
+ASSET_SOURCES = ("css/main.css", "js/main.js")
+ASSET_MANIFEST_PATH = os.path.join(app.static_folder, ASSET_DIST_DIR, "manifest.json")
+PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+
+def _file_sha256(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def load_asset_manifest():
+    """Map source filename -> built entry, skipping entries whose source changed since the build"""
+    try:
+        with open(ASSET_MANIFEST_PATH) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    fresh = {}
+    for source, entry in manifest.items():
+        try:
+            if _file_sha256(os.path.join(app.static_folder, source)) == entry["source_sha256"]:
+                fresh[source] = entry
+        except OSError:
+            pass
+    return fresh
+
+asset_manifest = load_asset_manifest()
+built_assets = {entry["file"]: entry for entry in asset_manifest.values()}
+
+@app.url_defaults
+def fingerprint_static_urls(endpoint, values):
+    """url_for('static', filename='css/main.css') -> the content-hashed build, when there is one"""
+    if endpoint == "static" and values.get("filename") in asset_manifest:
+        values["filename"] = asset_manifest[values["filename"]]["file"]
+
+def serve_static(filename):
+    """Static files, with precompressed variants of built assets chosen by Accept-Encoding"""
+    entry = built_assets.get(filename)
+    if entry is None:
+        return app.send_static_file(filename)
+    mimetype = mimetypes.guess_type(filename)[0]
+    for encoding, suffix in PRECOMPRESSED:
+        if encoding in entry.get("encodings", ()) and request.accept_encodings[encoding]:
+            response = send_from_directory(app.static_folder, filename + suffix, mimetype=mimetype, max_age=31536000)
+            response.headers["Content-Encoding"] = encoding
+            break
+    else:
+        response = send_from_directory(app.static_folder, filename, mimetype=mimetype, max_age=31536000)
+    # Hashed names never change content, so they can be cached for good
+    response.cache_control.immutable = True
+    response.vary.add("Accept-Encoding")
+    return response
+
+app.view_functions["static"] = serve_static
+
+# Request latency histograms per route, exported in Prometheus text format
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN")
+
+class Metrics:
+    """Process-wide aggregation of request latencies and spans"""
+
+    def __init__(self):
+        self.routes = {}
+        self.spans = {}
+        self._lock = threading.Lock()
+
+    def observe(self, route, seconds, spans):
+        with self._lock:
+            entry = self.routes.setdefault(route, [[0] * len(LATENCY_BUCKETS), 0.0, 0])
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    entry[0][i] += 1
+            entry[1] += seconds
+            entry[2] += 1
+            for name, (count, total) in spans.items():
+                span_entry = self.spans.setdefault((route, name), [0, 0.0])
+                span_entry[0] += count
+                span_entry[1] += total
+
+    def render(self):
+        with self._lock:
+            lines = [
+                "# HELP http_request_duration_seconds Request latency by route.",
+                "# TYPE http_request_duration_seconds histogram",
+            ]
+            for route, (buckets, total, count) in sorted(self.routes.items()):
+                for bound, hits in zip(LATENCY_BUCKETS, buckets):
+                    lines.append(f'http_request_duration_seconds_bucket{{route="{route}",le="{bound}"}} {hits}')
+                lines.append(f'http_request_duration_seconds_bucket{{route="{route}",le="+Inf"}} {count}')
+                lines.append(f'http_request_duration_seconds_sum{{route="{route}"}} {total:.6f}')
+                lines.append(f'http_request_duration_seconds_count{{route="{route}"}} {count}')
+            lines += [
+                "# HELP app_span_calls_total Firestore calls, template renders and PDF/QR renders by route.",
+                "# TYPE app_span_calls_total counter",
+            ]
+            lines += [f'app_span_calls_total{{route="{r}",span="{n}"}} {c}' for (r, n), (c, _) in sorted(self.spans.items())]
+            lines += [
+                "# HELP app_span_seconds_total Time spent in each span by route.",
+                "# TYPE app_span_seconds_total counter",
+            ]
+            lines += [f'app_span_seconds_total{{route="{r}",span="{n}"}} {t:.6f}' for (r, n), (_, t) in sorted(self.spans.items())]
+        lines += [
+            "# HELP app_cache_requests_total In-process cache lookups.",
+            "# TYPE app_cache_requests_total counter",
+        ]
+        for name, cache in sorted(TTLCache.registry.items()):
+            stats = cache.stats()
+            lines.append(f'app_cache_requests_total{{cache="{name}",result="hit"}} {stats["hits"]}')
+            lines.append(f'app_cache_requests_total{{cache="{name}",result="miss"}} {stats["misses"]}')
+        if CollectionMirror.registry:
+            lines += [
+                "# HELP app_mirror_live Whether the collection mirror listener is attached and in sync.",
+                "# TYPE app_mirror_live gauge",
+            ]
+            lines += [f'app_mirror_live{{collection="{name}"}} {int(m.live)}' for name, m in sorted(CollectionMirror.registry.items())]
+            lines += [
+                "# HELP app_mirror_stale_seconds Upper bound on how far the mirror lags Firestore.",
+                "# TYPE app_mirror_stale_seconds gauge",
+            ]
+            lines += [
+                f'app_mirror_stale_seconds{{collection="{name}"}} {m.staleness()}'
+                for name, m in sorted(CollectionMirror.registry.items()) if m.synced_at
+            ]
+        return "\n".join(lines) + "\n"
+
+metrics = Metrics()
+
+@app.before_request
+def start_request_timing():
+    g.request_start = time.perf_counter()
+    _request_timings.set(RequestTimings())
+
+@before_render_template.connect_via(app)
+def _template_render_started(sender, template, context, **extra):
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.template_start = time.perf_counter()
+
+@template_rendered.connect_via(app)
+def _template_render_finished(sender, template, context, **extra):
+    timings = _request_timings.get()
+    if timings is not None and timings.template_start is not None:
+        timings.add("template", time.perf_counter() - timings.template_start)
+        timings.template_start = None
+
+@app.after_request
+def add_server_timing(response):
+    """Expose this request's spans as Server-Timing and feed the route histograms"""
+    timings = _request_timings.get()
+    if timings is None or "request_start" not in g:
+        return response
+    total = time.perf_counter() - g.request_start
+    entries = [
+        f'{name};dur={seconds * 1000:.1f};desc="{count}x"'
+        for name, (count, seconds) in sorted(timings.spans.items())
+    ]
+    entries.append(f"total;dur={total * 1000:.1f}")
+    response.headers["Server-Timing"] = ", ".join(entries)
+    metrics.observe(request.endpoint or "unmatched", total, timings.spans)
+    return response
+
 TRANSLATIONS = {
     "id": {
         "nav_services": "Layanan",
@@ -130,6 +542,10 @@ TRANSLATIONS = {
         "quote_invoice_btn": "Generate Invoice PDF",
         "quote_schedule_btn": "Schedule Meeting",
         "quote_qr_title": "Scan untuk membuka proposal",
+        "invoice_pending_title": "Invoice sedang dibuat",
+        "invoice_pending_text": "PDF akan terunduh otomatis begitu selesai.",
+        "invoice_failed_text": "Invoice gagal dibuat. Silakan coba lagi.",
+        "invoice_pending_retry": "Coba lagi",
         "admin_dashboard_title": "Admin Dashboard",
         "admin_highlights_title": "Service Highlights",
         "admin_inquiries_title": "Recent Inquiries",
@@ -206,6 +622,10 @@ TRANSLATIONS = {
         "quote_invoice_btn": "Generate Invoice PDF",
         "quote_schedule_btn": "Schedule Meeting",
         "quote_qr_title": "Scan to open proposal",
+        "invoice_pending_title": "Preparing your invoice",
+        "invoice_pending_text": "The PDF will download automatically once it is ready.",
+        "invoice_failed_text": "The invoice could not be generated. Please try again.",
+        "invoice_pending_retry": "Try again",
         "admin_dashboard_title": "Admin Dashboard",
         "admin_highlights_title": "Service Highlights",
         "admin_inquiries_title": "Recent Inquiries",
@@ -282,6 +702,10 @@ TRANSLATIONS = {
         "quote_invoice_btn": "請求書PDFを生成",
         "quote_schedule_btn": "ミーティング予約",
         "quote_qr_title": "スキャンして提案を開く",
+        "invoice_pending_title": "請求書を作成中",
+        "invoice_pending_text": "準備ができるとPDFが自動的にダウンロードされます。",
+        "invoice_failed_text": "請求書を作成できませんでした。もう一度お試しください。",
+        "invoice_pending_retry": "再試行",
         "admin_dashboard_title": "管理ダッシュボード",
         "admin_highlights_title": "サービスハイライト",
         "admin_inquiries_title": "最近の問い合わせ",
@@ -303,18 +727,615 @@ def doc_to_dict(doc):
     # Keep created_at as datetime object for template formatting
     return data
 
+# Field projections for list views, so long proposal text is only loaded on detail routes
+QUOTE_CARD_FIELDS = ['client_name', 'project_name', 'scope', 'status']
+QUOTE_ROW_FIELDS = ['client_name', 'project_name', 'amount', 'status', 'token', 'created_at']
+INQUIRY_ROW_FIELDS = ['client_name', 'project_name', 'contact', 'budget', 'created_at']
+HIGHLIGHT_ROW_FIELDS = ['display_order', 'category', 'title', 'created_at']
+
+def query_dicts(query, fields=None, **stream_kwargs):
+    """Run a query and return documents as dicts, fetching only ``fields`` when given"""
+    if fields is not None:
+        query = query.select(fields)
+    return [doc_to_dict(doc) for doc in query.stream(**stream_kwargs)]
+
 def generate_token():
     """Generate unique token for quotes"""
     return secrets.token_urlsafe(10)
 
+# In-process cache for read-mostly Firestore queries
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after ``ttl`` seconds"""
+    registry = {}
+
+    def __init__(self, name, maxsize=128, ttl=300):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        TTLCache.registry[name] = self
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_load(self, key, loader):
+        """Return cached value for key, calling loader() on a miss"""
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = loader()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key=None):
+        """Drop one key, or every entry when key is None"""
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def invalidate_where(self, predicate):
+        """Drop every entry whose key satisfies predicate(key)"""
+        with self._lock:
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / total, 4) if total else 0.0,
+            }
+
+# Landing page lists only change on admin writes
+home_cache = TTLCache('home', maxsize=16, ttl=int(os.environ.get("HOME_CACHE_TTL", "300")))
+# Share token -> quote, shared by /q, /qr and /invoice (unknown tokens are cached as None)
+token_cache = TTLCache('quote_tokens', maxsize=512, ttl=int(os.environ.get("TOKEN_CACHE_TTL", "600")))
+
+# Rendered QR images keyed by (link, format, size)
+qr_cache = TTLCache('qr_images', maxsize=256, ttl=int(os.environ.get("QR_CACHE_TTL", "86400")))
+
+# Rendered invoice PDFs keyed by invoice_cache_key()
+invoice_cache = TTLCache(
+    'invoice_pdfs',
+    maxsize=int(os.environ.get("INVOICE_CACHE_SIZE", "32")),
+    ttl=int(os.environ.get("INVOICE_CACHE_TTL", "86400")),
+)
+
+def _load_quote_by_token(token):
+    mirror = live_mirror(quote_mirror)
+    if mirror:
+        return mirror.find(token)
+    # Point read through the quote_tokens/{token} -> quote_id mapping
+    mapping = db.collection('quote_tokens').document(token).get()
+    if mapping.exists:
+        quote_id = mapping.to_dict().get('quote_id')
+        return doc_to_dict(db.collection('quotes').document(quote_id).get()) if quote_id else None
+    # Quotes created before the mapping existed: query once, then store the mapping
+    quotes = list(db.collection('quotes').where('token', '==', token).limit(1).stream())
+    if not quotes:
+        return None
+    db.collection('quote_tokens').document(token).set({'quote_id': quotes[0].id})
+    return doc_to_dict(quotes[0])
+
+def get_quote_by_token(token):
+    """Find quote by share token through the token cache, None if unknown"""
+    quote = token_cache.get_or_load(token, lambda: _load_quote_by_token(token))
+    # Hand out a copy so views can annotate it without touching the cache
+    return dict(quote) if quote else None
+
+# Shared, bounded pool for issuing independent Firestore reads concurrently
+db_pool = ThreadPoolExecutor(max_workers=int(os.environ.get("DB_POOL_SIZE", "8")), thread_name_prefix="firestore")
+DB_QUERY_TIMEOUT = float(os.environ.get("DB_QUERY_TIMEOUT", "5"))
+
+def fetch_concurrently(loaders, timeout=DB_QUERY_TIMEOUT):
+    """Run {name: loader} on db_pool; a loader that fails or exceeds timeout yields None"""
+    # Each loader runs in a copy of this context so its spans reach the request
+    futures = {name: db_pool.submit(contextvars.copy_context().run, loader) for name, loader in loaders.items()}
+    deadline = time.monotonic() + timeout
+    results = {}
+    for name, future in futures.items():
+        try:
+            results[name] = future.result(timeout=max(0, deadline - time.monotonic()))
+        except Exception:
+            future.cancel()
+            results[name] = None
+    return results
+
 def get_lang():
     """Get current language from session, default to 'id'"""
     return session.get("lang", "id")
 
-def get_text(key):
-    """Get translated text for current language"""
-    lang = get_lang()
-    return TRANSLATIONS.get(lang, TRANSLATIONS["id"]).get(key, key)
+class Catalog(dict):
+    """Translations for one language, called in templates as t(key)"""
+
+    def __missing__(self, key):
+        return key
+
+    __call__ = dict.__getitem__
+
+CATALOGS = {lang: Catalog(texts) for lang, texts in TRANSLATIONS.items()}
+
+def get_catalog():
+    """Catalog for the current language, resolved once per request"""
+    if "catalog" not in g:
+        g.catalog = CATALOGS.get(get_lang(), CATALOGS["id"])
+    return g.catalog
+
+# Full-page cache for public pages, keyed by route, arguments, host and language
+PAGE_CACHE_TTL = int(os.environ.get("PAGE_CACHE_TTL", "300"))
+PAGE_S_MAXAGE = int(os.environ.get("PAGE_S_MAXAGE", "60"))
+PAGE_STALE_WHILE_REVALIDATE = int(os.environ.get("PAGE_STALE_WHILE_REVALIDATE", "600"))
+page_cache = TTLCache('pages', maxsize=256, ttl=PAGE_CACHE_TTL)
+
+def cached_page(view):
+    """Serve a public page from page_cache with an ETag and edge cache headers.
+
+    Admin sessions and requests with pending flash messages see
+    personalised output, so they bypass the cache.
+    """
+    @wraps(view)
+    def decorated_function(*args, **kwargs):
+        if session.get("admin_auth") or session.get("_flashes"):
+            return view(*args, **kwargs)
+        key = (request.endpoint, tuple(sorted(kwargs.items())), request.host, request.query_string, get_lang())
+        cached = page_cache.get(key)
+        if cached is None:
+            response = app.make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+            body = response.get_data()
+            cached = (body, hashlib.sha256(body).hexdigest()[:32])
+            page_cache.set(key, cached)
+        body, etag = cached
+        response = app.response_class(body, mimetype="text/html")
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = (
+            f"public, max-age=0, s-maxage={PAGE_S_MAXAGE}, "
+            f"stale-while-revalidate={PAGE_STALE_WHILE_REVALIDATE}"
+        )
+        return response.make_conditional(request)
+    return decorated_function
+
+def purge_pages(quote_id=None):
+    """Drop cached landing pages, plus the public page of quote_id if given"""
+    def affected(key):
+        endpoint, view_args = key[0], key[1]
+        return endpoint == "home" or (endpoint == "view_public_quote" and view_args == (("quote_id", quote_id),))
+    page_cache.invalidate_where(affected)
+
+# Optional live mirror for long-running workers: on_snapshot listeners keep
+# highlights and quotes in memory so public routes skip Firestore entirely
+FIRESTORE_LISTENERS = os.environ.get("FIRESTORE_LISTENERS", "0") == "1"
+MIRROR_RETRY_SECONDS = float(os.environ.get("MIRROR_RETRY_SECONDS", "30"))
+
+class CollectionMirror:
+    """In-memory copy of one collection kept current by an on_snapshot listener.
+
+    ``live`` is False until the first snapshot arrives and again whenever the
+    listener drops, so callers fall back to querying Firestore directly.
+    """
+    registry = {}
+
+    def __init__(self, collection, index_field=None, on_change=None, retry=30):
+        self.collection = collection
+        self.index_field = index_field
+        self.on_change = on_change
+        self.retry = retry
+        self.snapshots = 0
+        self.synced_at = None
+        self.last_error = None
+        self._docs = {}
+        self._index = {}
+        self._synced = False
+        self._watch = PerProcess(self._attach, alive=lambda watch: watch.is_active)
+        self._next_attempt = 0.0
+        self._lock = threading.Lock()
+        CollectionMirror.registry[collection] = self
+
+    def _attached(self):
+        watch = self._watch.peek()
+        return watch is not None and watch.is_active
+
+    @property
+    def live(self):
+        return self._synced and self._attached()
+
+    def ensure_started(self):
+        """Attach the listener in this process, retrying every ``retry`` seconds after a failure"""
+        if self._attached():
+            return
+        with self._lock:
+            if self._attached() or time.monotonic() < self._next_attempt:
+                return
+            self._next_attempt = time.monotonic() + self.retry
+            try:
+                self._watch.get()
+            except Exception as exc:
+                self.last_error = repr(exc)
+
+    def _attach(self):
+        self._synced = False
+        return db.collection(self.collection).on_snapshot(self._on_snapshot)
+
+    def _on_snapshot(self, docs, changes, read_time):
+        # Runs on the listener thread with the full, current result set
+        rows = {doc.id: doc_to_dict(doc) for doc in docs}
+        index = {}
+        if self.index_field:
+            index = {row[self.index_field]: doc_id for doc_id, row in rows.items() if row.get(self.index_field)}
+        with self._lock:
+            self._docs, self._index = rows, index
+            self._synced = True
+            self.synced_at = time.time()
+            self.snapshots += 1
+        if self.on_change:
+            self.on_change({change.document.id for change in changes})
+
+    def get(self, doc_id):
+        row = self._docs.get(doc_id)
+        return dict(row) if row else None
+
+    def find(self, value):
+        """Document whose index_field equals value"""
+        return self.get(self._index.get(value))
+
+    def ordered(self, field, descending=False, limit=None, fields=None):
+        """Rows sorted like order_by(field); rows missing the field are left out, as in Firestore"""
+        rows = sorted((row for row in self._docs.values() if row.get(field) is not None),
+                      key=lambda row: row[field], reverse=descending)[:limit]
+        if fields is not None:
+            keep = set(fields) | {'id'}
+            return [{key: value for key, value in row.items() if key in keep} for row in rows]
+        return [dict(row) for row in rows]
+
+    def staleness(self):
+        """0 while live; otherwise seconds since the last snapshot (an upper bound), None if never synced"""
+        if self.live:
+            return 0.0
+        return round(time.time() - self.synced_at, 1) if self.synced_at else None
+
+    def stats(self):
+        return {
+            'live': self.live,
+            'stale_seconds': self.staleness(),
+            'documents': len(self._docs),
+            'snapshots': self.snapshots,
+            'last_error': self.last_error,
+        }
+
+def _quotes_changed(quote_ids):
+    home_cache.invalidate()
+    token_cache.invalidate()
+    for quote_id in quote_ids:
+        purge_pages(quote_id)
+
+def _highlights_changed(_):
+    home_cache.invalidate()
+    purge_pages()
+
+quote_mirror = highlight_mirror = None
+if FIRESTORE_LISTENERS:
+    quote_mirror = CollectionMirror('quotes', index_field='token', on_change=_quotes_changed, retry=MIRROR_RETRY_SECONDS)
+    highlight_mirror = CollectionMirror('highlights', on_change=_highlights_changed, retry=MIRROR_RETRY_SECONDS)
+
+@app.before_request
+def start_mirrors():
+    for mirror in CollectionMirror.registry.values():
+        mirror.ensure_started()
+
+def live_mirror(mirror):
+    """The mirror if it is enabled and in sync, else None"""
+    return mirror if mirror is not None and mirror.live else None
+
+# ===== ADMIN SEARCH =====
+SEARCH_INDEX_TTL = int(os.environ.get("SEARCH_INDEX_TTL", "900"))
+SEARCH_RESULT_LIMIT = int(os.environ.get("SEARCH_RESULT_LIMIT", "50"))
+# Matches in names count more than matches deep inside proposal text
+SEARCH_FIELD_WEIGHTS = {
+    'client_name': 3.0,
+    'project_name': 3.0,
+    'contact': 2.0,
+    'scope': 1.0,
+    'technical_approach': 1.0,
+    'deliverables': 1.0,
+    'timeline': 1.0,
+    'tech_stack': 1.0,
+    'team_structure': 1.0,
+    'assumptions': 1.0,
+    'payment_terms': 1.0,
+}
+SEARCH_SUMMARY_FIELDS = ('client_name', 'project_name', 'contact', 'status', 'token', 'amount', 'budget', 'created_at')
+SEARCH_SOURCES = {'quote': 'quotes', 'inquiry': 'inquiries'}
+_SEARCH_TERM = re.compile(r"\w+")
+
+def search_terms(text):
+    """Lower-cased word tokens of text"""
+    return _SEARCH_TERM.findall(str(text or "").lower())
+
+class SearchIndex:
+    """In-memory inverted index over quotes and inquiries.
+
+    Built from one projected read of both collections on first use (and again
+    after ``ttl`` seconds, to pick up writes made by other workers); admin
+    writes in this process update it in place.
+    """
+
+    def __init__(self, ttl=900, max_expansions=64):
+        self.ttl = ttl
+        self.max_expansions = max_expansions
+        self.built_at = None
+        self.last_build_ms = None
+        self._postings = {}   # term -> {doc key: weighted term frequency}
+        self._docs = {}       # doc key -> (summary, terms)
+        self._sorted_terms = None
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+
+    @staticmethod
+    def _analyze(data):
+        weights = {}
+        for field, weight in SEARCH_FIELD_WEIGHTS.items():
+            for term in search_terms(data.get(field)):
+                weights[term] = weights.get(term, 0.0) + weight
+        return weights
+
+    def _remove_locked(self, key):
+        entry = self._docs.pop(key, None)
+        if entry is None:
+            return None
+        for term in entry[1]:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(key, None)
+                if not postings:
+                    del self._postings[term]
+                    self._sorted_terms = None
+        return entry[0]
+
+    def _add_locked(self, key, summary, weights):
+        for term, weight in weights.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._sorted_terms = None
+            postings[key] = weight
+        self._docs[key] = (summary, frozenset(weights))
+
+    def add(self, kind, doc_id, data):
+        """Index or re-index one document from its full field data"""
+        if self.built_at is None:
+            return  # the first search reads everything anyway
+        key = (kind, doc_id)
+        with self._lock:
+            # Partial updates (no token/created_at) keep the rest of the summary
+            summary = self._remove_locked(key) or {}
+            summary.update({field: data[field] for field in SEARCH_SUMMARY_FIELDS if field in data})
+            summary.update(kind=kind, id=doc_id)
+            self._add_locked(key, summary, self._analyze(data))
+
+    def remove(self, kind, doc_id):
+        with self._lock:
+            self._remove_locked((kind, doc_id))
+
+    def ensure_built(self):
+        """(Re)build from Firestore when the index is missing or older than ttl"""
+        if self.built_at is not None and time.monotonic() - self.built_at < self.ttl:
+            return
+        with self._build_lock:
+            if self.built_at is not None and time.monotonic() - self.built_at < self.ttl:
+                return
+            started = time.perf_counter()
+            fields = sorted(set(SEARCH_FIELD_WEIGHTS) | set(SEARCH_SUMMARY_FIELDS))
+            postings, docs = {}, {}
+            for kind, collection in SEARCH_SOURCES.items():
+                for row in query_dicts(db.collection(collection), fields):
+                    key = (kind, row['id'])
+                    summary = {field: row[field] for field in SEARCH_SUMMARY_FIELDS if field in row}
+                    summary.update(kind=kind, id=row['id'])
+                    weights = self._analyze(row)
+                    for term, weight in weights.items():
+                        postings.setdefault(term, {})[key] = weight
+                    docs[key] = (summary, frozenset(weights))
+            with self._lock:
+                self._postings, self._docs, self._sorted_terms = postings, docs, None
+                self.built_at = time.monotonic()
+                self.last_build_ms = round((time.perf_counter() - started) * 1000, 1)
+
+    def _expand(self, term):
+        """Indexed terms starting with term, exact match first"""
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        terms = self._sorted_terms
+        start = bisect.bisect_left(terms, term)
+        matches = []
+        for candidate in terms[start:start + self.max_expansions]:
+            if not candidate.startswith(term):
+                break
+            matches.append(candidate)
+        return matches
+
+    def search(self, query, limit=50):
+        """Documents matching every query term (as a word prefix), best first"""
+        terms = list(dict.fromkeys(search_terms(query)))
+        if not terms:
+            return []
+        self.ensure_built()
+        with self._lock:
+            total = len(self._docs) or 1
+            scores = None
+            for term in terms:
+                term_scores = {}
+                for candidate in self._expand(term):
+                    postings = self._postings[candidate]
+                    # Rare terms rank higher; a whole-word hit beats a prefix hit
+                    boost = math.log(1 + total / len(postings)) * (1.0 if candidate == term else 0.5)
+                    for key, weight in postings.items():
+                        term_scores[key] = term_scores.get(key, 0.0) + weight * boost
+                if scores is None:
+                    scores = term_scores
+                else:
+                    scores = {key: score + term_scores[key] for key, score in scores.items() if key in term_scores}
+                if not scores:
+                    return []
+            ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+            results = []
+            for key, score in ranked:
+                results.append(dict(self._docs[key][0], score=round(score, 3)))
+            return results
+
+    def stats(self):
+        with self._lock:
+            return {
+                'documents': len(self._docs),
+                'terms': len(self._postings),
+                'built': self.built_at is not None,
+                'age_seconds': round(time.monotonic() - self.built_at, 1) if self.built_at is not None else None,
+                'last_build_ms': self.last_build_ms,
+            }
+
+search_index = SearchIndex(ttl=SEARCH_INDEX_TTL)
+
+# Admission control for CPU-heavy and write endpoints
+class TokenBucket:
+    """Refills ``rate`` tokens per second up to ``burst``; not thread-safe on its own"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def take(self):
+        """Consume a token; returns 0 on success, else seconds until one is available"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.rate
+
+class RateLimiter:
+    """Per-client and global token buckets for one group of endpoints"""
+
+    def __init__(self, name, per_client, overall, max_clients=10000):
+        self.name = name
+        self.per_client = per_client
+        self.overall = TokenBucket(*overall)
+        self.max_clients = max_clients
+        self.rejected = 0
+        self._clients = OrderedDict()
+        self._lock = threading.Lock()
+
+    def check(self, client):
+        """Returns 0 if the request may proceed, else a Retry-After in seconds"""
+        with self._lock:
+            bucket = self._clients.get(client)
+            if bucket is None:
+                bucket = self._clients[client] = TokenBucket(*self.per_client)
+                if len(self._clients) > self.max_clients:
+                    self._clients.popitem(last=False)
+            self._clients.move_to_end(client)
+            wait = bucket.take() or self.overall.take()
+            if wait:
+                self.rejected += 1
+            return wait
+
+def _rate(env_name, default):
+    """Parse a 'count/seconds' limit into (tokens per second, burst)"""
+    count, seconds = os.environ.get(env_name, default).split("/")
+    return int(count) / float(seconds), int(count)
+
+invoice_limiter = RateLimiter(
+    'invoice', _rate("RATE_LIMIT_INVOICE_PER_IP", "10/60"), _rate("RATE_LIMIT_INVOICE_GLOBAL", "120/60"))
+qr_limiter = RateLimiter(
+    'qr', _rate("RATE_LIMIT_QR_PER_IP", "60/60"), _rate("RATE_LIMIT_QR_GLOBAL", "1200/60"))
+inquiry_limiter = RateLimiter(
+    'inquiry', _rate("RATE_LIMIT_INQUIRY_PER_IP", "5/300"), _rate("RATE_LIMIT_INQUIRY_GLOBAL", "120/60"))
+
+# Simultaneous PDF renders allowed per process
+PDF_MAX_CONCURRENT = int(os.environ.get("PDF_MAX_CONCURRENT", "2"))
+
+# PDF and QR renders hold the GIL; with RENDER_PROCESSES > 0 they run in worker
+# processes so threads waiting on Firestore keep getting scheduled
+RENDER_PROCESSES = int(os.environ.get("RENDER_PROCESSES", "0"))
+
+def new_process_pool(workers):
+    """ProcessPoolExecutor with workers processes, or None where processes cannot be started"""
+    from concurrent.futures import ProcessPoolExecutor
+    try:
+        return ProcessPoolExecutor(max_workers=workers)
+    except (OSError, NotImplementedError):
+        # No POSIX semaphores (e.g. serverless sandboxes)
+        return None
+
+# False rather than None when unavailable: keep rendering inline without retrying
+_render_pool = PerProcess(lambda: new_process_pool(RENDER_PROCESSES) or False)
+
+def run_render(func, *args):
+    """Call func(*args) in the render process pool, or inline when it is disabled or unavailable"""
+    if RENDER_PROCESSES <= 0:
+        return func(*args)
+    from concurrent.futures.process import BrokenProcessPool
+
+    pool = _render_pool.get()
+    if not pool:
+        return func(*args)
+    try:
+        return pool.submit(func, *args).result()
+    except BrokenProcessPool:
+        _render_pool.reset(pool)
+        return func(*args)
+
+def client_ip():
+    # ProxyFix has already resolved trusted forwarding hops into remote_addr
+    return request.remote_addr or "unknown"
+
+def too_many_requests(retry_after):
+    return Response(
+        "Too many requests, please retry later.\n",
+        status=429,
+        mimetype="text/plain",
+        headers={"Retry-After": str(max(1, int(retry_after + 0.999)))},
+    )
+
+def rate_limited(limiter):
+    """Reject requests over the limiter's budget with 429 before the view runs"""
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            wait = limiter.check(client_ip())
+            if wait:
+                return too_many_requests(wait)
+            return f(*args, **kwargs)
+        return decorated_function
+    return decorator
 
 # Authentication decorator
 def admin_required(f):
@@ -334,27 +1355,162 @@ def set_lang(lang):
         session["lang"] = lang
     return redirect(request.referrer or url_for("home"))
 
-@app.route("/")
-def home():
-    # Get highlights from Firestore
+def _load_home_highlights():
+    mirror = live_mirror(highlight_mirror)
+    if mirror:
+        return mirror.ordered('display_order', limit=6, fields=['category', 'title', 'body'])
     highlights_ref = db.collection('highlights').order_by('display_order').limit(6)
-    highlights_docs = highlights_ref.stream()
-    highlights = [doc_to_dict(doc) for doc in highlights_docs]
-    
-    # Get quotes from Firestore
+    return query_dicts(highlights_ref, ['category', 'title', 'body'])
+
+def _load_home_quotes():
+    mirror = live_mirror(quote_mirror)
+    if mirror:
+        return mirror.ordered('created_at', descending=True, limit=6, fields=QUOTE_CARD_FIELDS)
     quotes_ref = db.collection('quotes').order_by('created_at', direction=firestore.Query.DESCENDING).limit(6)
-    quotes_docs = quotes_ref.stream()
-    quotes = [doc_to_dict(doc) for doc in quotes_docs]
+    return query_dicts(quotes_ref, QUOTE_CARD_FIELDS)
+
+@app.route("/")
+@cached_page
+def home():
+    # Highlights and portfolio are served from the in-process cache;
+    # when both have expired they are fetched in parallel
+    loaders = {'highlights': _load_home_highlights, 'quotes': _load_home_quotes}
+    sections = {name: home_cache.get(name) for name in loaders}
+    missing = {name: loader for name, loader in loaders.items() if sections[name] is None}
+    fetched = fetch_concurrently(missing) if len(missing) > 1 else {}
+    for name, loader in missing.items():
+        # A failed parallel load is retried inline so errors surface as before
+        value = fetched.get(name)
+        sections[name] = value if value is not None else loader()
+        home_cache.set(name, sections[name])
     
     return render_template(
         "index.html",
-        highlights=highlights,
-        quotes=quotes,
-        t=get_text,
+        highlights=sections['highlights'],
+        quotes=sections['quotes'],
+        t=get_catalog(),
         lang=get_lang()
     )
 
+# Write-behind queue for inquiries: accepted into a local SQLite spool, then
+# committed to Firestore in batches by a background worker
+class InquirySpool:
+    """Durable SQLite spool flushed to the inquiries collection in WriteBatch commits"""
+
+    def __init__(self, path, batch_size=100, interval=2.0, max_backoff=60.0):
+        self.path = path
+        self.batch_size = min(batch_size, 500)
+        self.interval = interval
+        self.max_backoff = max_backoff
+        self.failures = 0
+        self.last_error = None
+        self.last_flush = None
+        self._wake = threading.Event()
+        self._worker = PerProcess(self._start_worker, alive=lambda worker: worker.is_alive())
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS spool ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, doc_id TEXT NOT NULL, "
+                "payload TEXT NOT NULL, received_at REAL NOT NULL)"
+            )
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute("PRAGMA synchronous=FULL")
+        return conn
+
+    def put(self, data):
+        """Persist one inquiry; returns once the row is committed to disk"""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO spool (doc_id, payload, received_at) VALUES (?, ?, ?)",
+                (uuid.uuid4().hex, json.dumps(data), time.time()),
+            )
+        self.ensure_worker()
+        self._wake.set()
+
+    def depth(self):
+        with self._connect() as conn:
+            depth = conn.execute("SELECT COUNT(*) FROM spool").fetchone()[0]
+        if depth:
+            # Rows left over from a previous process still need a worker
+            self.ensure_worker()
+        return depth
+
+    def stats(self):
+        with self._connect() as conn:
+            depth, oldest = conn.execute("SELECT COUNT(*), MIN(received_at) FROM spool").fetchone()
+        if depth:
+            self.ensure_worker()
+        return {
+            'depth': depth,
+            'oldest_age_seconds': round(time.time() - oldest, 1) if oldest else 0,
+            'failures': self.failures,
+            'last_error': self.last_error,
+            'last_flush': self.last_flush,
+        }
+
+    def ensure_worker(self):
+        self._worker.get()
+
+    def _start_worker(self):
+        worker = threading.Thread(target=self._run, name="inquiry-spool", daemon=True)
+        worker.start()
+        return worker
+
+    def flush(self):
+        """Commit up to batch_size spooled inquiries; returns how many were written"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT id, doc_id, payload, received_at FROM spool ORDER BY id LIMIT ?",
+                (self.batch_size,),
+            ).fetchall()
+        if not rows:
+            return 0
+        batch = db.batch()
+        inquiries = db.collection('inquiries')
+        written = []
+        for _, doc_id, payload, received_at in rows:
+            data = json.loads(payload)
+            data['created_at'] = datetime.fromtimestamp(received_at, timezone.utc)
+            # Spool ids become document ids, so a retried batch overwrites instead of duplicating
+            batch.set(inquiries.document(doc_id), data)
+            written.append((doc_id, data))
+        batch.commit()
+        for doc_id, data in written:
+            search_index.add('inquiry', doc_id, data)
+        with self._connect() as conn:
+            conn.executemany("DELETE FROM spool WHERE id = ?", [(row[0],) for row in rows])
+        self.last_flush = datetime.now(timezone.utc).isoformat()
+        return len(rows)
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                while self.flush() == self.batch_size:
+                    pass
+                self.failures = 0
+                self.last_error = None
+            except Exception as e:
+                self.failures += 1
+                self.last_error = str(e)
+                time.sleep(min(self.max_backoff, 2 ** self.failures))
+
+# Opt-in: serverless /tmp and frozen threads would lose spooled inquiries
+INQUIRY_WRITE_BEHIND = os.environ.get("INQUIRY_WRITE_BEHIND", "0") == "1" and not os.environ.get("VERCEL")
+inquiry_spool = InquirySpool(
+    os.environ.get("INQUIRY_SPOOL_PATH", os.path.join(tempfile.gettempdir(), "prime-projectx-inquiries.sqlite3")),
+    batch_size=int(os.environ.get("INQUIRY_SPOOL_BATCH", "100")),
+) if INQUIRY_WRITE_BEHIND else None
+if inquiry_spool:
+    # Drain whatever a crashed or restarted process left behind
+    inquiry_spool.depth()
+
 @app.route("/inquiries", methods=["POST"])
+@rate_limited(inquiry_limiter)
 def create_inquiry():
     client_name = request.form.get("client_name", "").strip()
     project_name = request.form.get("project_name", "").strip()
@@ -373,7 +1529,6 @@ def create_inquiry():
         except ValueError:
             pass
     
-    # Save to Firestore
     inquiry_data = {
         'client_name': client_name,
         'project_name': project_name,
@@ -381,23 +1536,28 @@ def create_inquiry():
         'contact': contact,
         'budget': budget,
         'status': 'New',
-        'created_at': firestore.SERVER_TIMESTAMP
     }
-    db.collection('inquiries').add(inquiry_data)
+    if inquiry_spool:
+        # Durable locally; the spool worker writes it to Firestore
+        inquiry_spool.put(inquiry_data)
+    else:
+        inquiry_data['created_at'] = firestore.SERVER_TIMESTAMP
+        _, inquiry_ref = db.collection('inquiries').add(inquiry_data)
+        search_index.add('inquiry', inquiry_ref.id, dict(inquiry_data, created_at=datetime.now(timezone.utc)))
     
     flash("Pengajuan berhasil dikirim. Tim kami akan menghubungi Anda.", "success")
     return redirect(url_for("home"))
 
 @app.route("/p/<quote_id>")
+@cached_page
 def view_public_quote(quote_id):
     # Public view accessed from portfolio list
-    quote_ref = db.collection('quotes').document(quote_id)
-    quote_doc = quote_ref.get()
+    mirror = live_mirror(quote_mirror)
+    quote = mirror.get(quote_id) if mirror else doc_to_dict(db.collection('quotes').document(quote_id).get())
     
-    if not quote_doc.exists:
+    if not quote:
         abort(404)
     
-    quote = doc_to_dict(quote_doc)
     if quote.get('token'):
         quote['url'] = url_for("view_quote", token=quote['token'], _external=True)
     
@@ -405,61 +1565,147 @@ def view_public_quote(quote_id):
         "quotation.html",
         quote=quote,
         is_full_access=False,
-        t=get_text,
+        t=get_catalog(),
         lang=get_lang()
     )
 
 @app.route("/q/<token>")
 def view_quote(token):
     # Private view accessed via QR code / direct link
-    # Find quote by token in Firestore
-    quotes_ref = db.collection('quotes').where('token', '==', token).limit(1)
-    quotes = list(quotes_ref.stream())
+    quote = get_quote_by_token(token)
     
-    if not quotes:
+    if not quote:
         abort(404)
     
-    quote = doc_to_dict(quotes[0])
     quote['url'] = url_for("view_quote", token=token, _external=True)
     
     return render_template(
         "quotation.html",
         quote=quote,
         is_full_access=True,
-        t=get_text,
+        t=get_catalog(),
         lang=get_lang()
     )
 
+QR_FILL_COLOR = "#00eaff"
+QR_BACK_COLOR = "#0a0f1a"
+QR_MIMETYPES = {"png": "image/png", "svg": "image/svg+xml"}
+
+def render_qr(link, fmt="png", size=None):
+    """Render link as a QR image; size is the target width in pixels"""
+    import qrcode
+
+    qr = qrcode.QRCode(box_size=8, border=2)
+    qr.add_data(link)
+    qr.make(fit=True)
+    modules = qr.modules_count + 2 * qr.border
+
+    if fmt == "svg":
+        # One path of unit squares in module coordinates, scaled by the viewBox
+        path = "".join(
+            f"M{x} {y}h1v1h-1z"
+            for y, row in enumerate(qr.get_matrix())
+            for x, dark in enumerate(row) if dark
+        )
+        width = size or modules * qr.box_size
+        svg = (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{width}" '
+            f'viewBox="0 0 {modules} {modules}" shape-rendering="crispEdges">'
+            f'<rect width="100%" height="100%" fill="{QR_BACK_COLOR}"/>'
+            f'<path fill="{QR_FILL_COLOR}" d="{path}"/></svg>'
+        )
+        return svg.encode("utf-8")
+
+    if size:
+        qr.box_size = max(1, size // modules)
+    img = qr.make_image(fill_color=QR_FILL_COLOR, back_color=QR_BACK_COLOR).get_image()
+    if size and img.width != size:
+        # Modules stay whole pixels; the remainder widens the quiet zone
+        from PIL import Image
+
+        if img.width > size:
+            img = img.resize((size, size), Image.NEAREST)
+        else:
+            canvas = Image.new(img.mode, (size, size), QR_BACK_COLOR)
+            offset = (size - img.width) // 2
+            canvas.paste(img, (offset, offset))
+            img = canvas
+    buf = io.BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
 @app.route("/qr/<token>")
+@rate_limited(qr_limiter)
 def qr_image(token):
     # Find quote by token
-    quotes_ref = db.collection('quotes').where('token', '==', token).limit(1)
-    quotes = list(quotes_ref.stream())
+    if not get_quote_by_token(token):
+        abort(404)
     
-    if not quotes:
+    fmt = request.args.get("format", "png").lower()
+    if fmt not in QR_MIMETYPES:
         abort(404)
+    size = request.args.get("size", type=int)
+    if size is not None:
+        size = min(max(size, 64), 1024)
     
+    # The image only depends on the link, so render once and memoize
     link = url_for("view_quote", token=token, _external=True)
-    qr = qrcode.QRCode(box_size=8, border=2)
-    qr.add_data(link)
-    qr.make(fit=True)
-    img = qr.make_image(fill_color="#00eaff", back_color="#0a0f1a")
-    buf = io.BytesIO()
-    img.save(buf, format="PNG")
-    buf.seek(0)
-    return send_file(buf, mimetype="image/png")
+    key = (link, fmt, size)
+    cached = qr_cache.get(key)
+    if cached is None:
+        with span("qr"):
+            data = run_render(render_qr, link, fmt, size)
+        cached = (data, hashlib.sha256(data).hexdigest()[:32])
+        qr_cache.set(key, cached)
+    data, etag = cached
+    
+    response = app.response_class(data, mimetype=QR_MIMETYPES[fmt])
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = 31536000
+    response.cache_control.immutable = True
+    return response.make_conditional(request)
 
 
-@app.route("/invoice/<token>")
-def invoice_pdf(token):
-    # Generate a simple PDF invoice for the quote token
-    quotes_ref = db.collection('quotes').where('token', '==', token).limit(1)
-    quotes = list(quotes_ref.stream())
+# Quote fields read by render_invoice_pdf; a change to any of them means a fresh render
+INVOICE_FIELDS = (
+    'project_name', 'client_name', 'amount', 'created_at', 'status', 'scope',
+    'technical_approach', 'tech_stack', 'deliverables', 'timeline',
+    'team_structure', 'assumptions', 'payment_terms',
+)
+INVOICE_LAYOUT_VERSION = 1
 
-    if not quotes:
-        abort(404)
+def invoice_cache_key(quote):
+    """Content hash of the quote fields the invoice renderer reads"""
+    fields = {field: quote.get(field) for field in INVOICE_FIELDS}
+    fields['_layout'] = INVOICE_LAYOUT_VERSION
+    payload = json.dumps(fields, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def invoice_filename(quote):
+    project_name = quote.get('project_name', 'proposal')
+    safe_name = "".join(c for c in project_name if c.isalnum() or c in (" ", "_", "-")) or "proposal"
+    return f"Invoice-{safe_name}.pdf"
+
+def render_invoice_pdf(quote, generated_at=None):
+    """Lay out the invoice/proposal PDF for a quote dict and return its bytes"""
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import A4
+
+    buf = io.BytesIO()
+    pdf = canvas.Canvas(buf, pagesize=A4)
+    draw_invoice(pdf, quote, generated_at)
+    pdf.save()
+    return buf.getvalue()
+
+def draw_invoice(pdf, quote, generated_at=None):
+    """Draw the invoice pages for one quote onto a ReportLab canvas.
+
+    Needs no Flask request, so it can run in worker processes.
+    """
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.utils import ImageReader
 
-    quote = doc_to_dict(quotes[0])
     project_name = quote.get('project_name', 'proposal')
     client_name = quote.get('client_name', 'Client')
     amount = quote.get('amount') or 0
@@ -484,8 +1730,6 @@ def invoice_pdf(token):
             lines.extend(wrapped)
         return lines
 
-    buf = io.BytesIO()
-    pdf = canvas.Canvas(buf, pagesize=A4)
     width, height = A4
     margin_left = 45
     margin_right = width - 45
@@ -494,7 +1738,7 @@ def invoice_pdf(token):
     
     # GMT+7 timezone
     gmt7 = timezone(timedelta(hours=7))
-    current_time = datetime.now(gmt7).strftime('%Y-%m-%d %H:%M WIB')
+    current_time = (generated_at or datetime.now(gmt7)).astimezone(gmt7).strftime('%Y-%m-%d %H:%M WIB')
 
     def draw_page_number():
         pdf.setFont("Helvetica", 8)
@@ -743,12 +1987,232 @@ def invoice_pdf(token):
 
     draw_page_number()
     pdf.showPage()
-    pdf.save()
 
-    buf.seek(0)
-    safe_name = "".join(c for c in project_name if c.isalnum() or c in (" ", "_", "-")) or "proposal"
-    filename = f"Invoice-{safe_name}.pdf"
-    return send_file(buf, mimetype="application/pdf", as_attachment=True, download_name=filename)
+# Invoice renders run as jobs on a local pool; identical requests share a job
+INVOICE_JOB_QUEUE = int(os.environ.get("INVOICE_JOB_QUEUE", "32"))
+INVOICE_JOB_TTL = int(os.environ.get("INVOICE_JOB_TTL", "900"))
+# Keep the inline wait short, as the render semaphore did, and well under serverless function timeouts
+INVOICE_SYNC_WAIT = float(os.environ.get("INVOICE_SYNC_WAIT", "5"))
+# Job links need the render thread to keep running and polls to reach this process;
+# serverless instances are frozen between requests and do not share memory
+INVOICE_JOB_LINKS = not os.environ.get("VERCEL")
+
+class InvoiceJob:
+    """One background render of an invoice PDF"""
+
+    def __init__(self, key, filename):
+        self.id = secrets.token_urlsafe(16)
+        self.key = key
+        self.filename = filename
+        self.status = 'queued'
+        self.error = None
+        self.result = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self._done = threading.Event()
+
+    def wait(self, timeout=None):
+        return self._done.wait(timeout)
+
+    def finish(self, result=None, error=None):
+        self.result, self.error = result, error
+        self.status = 'failed' if error else 'done'
+        self.finished_at = time.time()
+        self._done.set()
+
+class InvoiceJobQueue:
+    """Runs invoice renders on a bounded local pool, one job per distinct quote content"""
+
+    def __init__(self, workers, max_pending, ttl):
+        self.max_pending = max_pending
+        # Finished jobs stay downloadable; unfinished ones live in _active and are never evicted
+        self.jobs = TTLCache('invoice_jobs', maxsize=max(16, max_pending * 4), ttl=ttl)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="invoice")
+        self._active = OrderedDict()  # content key -> unfinished job, oldest first
+        self._active_ids = {}         # job id -> unfinished job
+        self._lock = threading.Lock()
+
+    def submit(self, quote):
+        """Job rendering quote; None when the queue is full"""
+        key = invoice_cache_key(quote)
+        with self._lock:
+            job = self._active.get(key)
+            if job is not None:
+                return job
+            cached = invoice_cache.get(key)
+            if cached is None and len(self._active) >= self.max_pending:
+                return None
+            job = InvoiceJob(key, invoice_filename(quote))
+            self.jobs.set(job.id, job)
+            if cached is not None:
+                job.finish(cached)
+                return job
+            self._active[key] = job
+            self._active_ids[job.id] = job
+        self._pool.submit(self._run, job, quote)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            job = self._active_ids.get(job_id)
+        return job or self.jobs.get(job_id)
+
+    def _run(self, job, quote):
+        job.status = 'rendering'
+        job.started_at = time.time()
+        try:
+            data = run_render(render_invoice_pdf, quote, datetime.now(timezone.utc))
+            result = (data, hashlib.sha256(data).hexdigest()[:32])
+            invoice_cache.set(job.key, result)
+            job.finish(result)
+        except Exception as e:
+            app.logger.exception("Invoice render job %s failed", job.id)
+            job.finish(error=str(e))
+        finally:
+            with self._lock:
+                self._active.pop(job.key, None)
+                self._active_ids.pop(job.id, None)
+                # Restart the TTL from completion so the result can be fetched
+                self.jobs.set(job.id, job)
+
+    def describe(self, job):
+        """Status payload for the polling endpoint"""
+        now = time.time()
+        info = {
+            'job_id': job.id,
+            'status': job.status,
+            'filename': job.filename,
+            'status_url': url_for('invoice_job_status', job_id=job.id),
+            'download_url': url_for('invoice_job_download', job_id=job.id),
+            'elapsed_seconds': round((job.finished_at or now) - job.created_at, 2),
+        }
+        if job.status == 'queued':
+            with self._lock:
+                waiting = [j for j in self._active.values() if j.status == 'queued']
+            info['queue_position'] = waiting.index(job) + 1 if job in waiting else 1
+        if job.error:
+            # Anyone holding the job id can poll; the details are in the server log
+            info['error'] = "render failed"
+        return info
+
+# Pool size caps concurrent renders so a burst cannot occupy every worker
+invoice_jobs = InvoiceJobQueue(PDF_MAX_CONCURRENT, INVOICE_JOB_QUEUE, INVOICE_JOB_TTL)
+
+def invoice_response(data, etag, filename):
+    response = send_file(
+        io.BytesIO(data),
+        mimetype="application/pdf",
+        as_attachment=True,
+        download_name=filename,
+        etag=etag,
+        max_age=0,
+    )
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+def job_accepted(job):
+    """202 pointing the client at the job status endpoint"""
+    response = jsonify(invoice_jobs.describe(job))
+    response.status_code = 202
+    response.headers['Location'] = url_for('invoice_job_status', job_id=job.id)
+    response.headers['Retry-After'] = "2"
+    return response
+
+def wants_html():
+    """Browser navigation rather than an API client (which gets JSON for */*)"""
+    return request.accept_mimetypes.best_match(["application/json", "text/html"]) == "text/html"
+
+def invoice_pending_page(job, token):
+    """Page that waits for the job and then downloads the PDF"""
+    links = INVOICE_JOB_LINKS
+    html = render_template(
+        "invoice_pending.html",
+        status_url=url_for('invoice_job_status', job_id=job.id) if links else None,
+        download_url=url_for('invoice_job_download', job_id=job.id) if links else None,
+        retry_url=url_for('invoice_pdf', token=token),
+        t=get_catalog(),
+        lang=get_lang(),
+    )
+    # Without job links the page reloads /invoice/<token>, like any other retry
+    return html, 202 if links else 503, {"Retry-After": "2" if links else "5", "Cache-Control": "no-store"}
+
+def still_rendering():
+    return Response(
+        "Invoice is still rendering, please retry shortly.\n",
+        status=503,
+        mimetype="text/plain",
+        headers={"Retry-After": "5"},
+    )
+
+@app.route("/invoice/<token>")
+@rate_limited(invoice_limiter)
+def invoice_pdf(token):
+    # Generate a simple PDF invoice for the quote token
+    quote = get_quote_by_token(token)
+
+    if not quote:
+        abort(404)
+
+    # Renders are keyed by content, so an edited quote gets a fresh PDF
+    cached = invoice_cache.get(invoice_cache_key(quote))
+    if cached is None:
+        job = invoice_jobs.submit(quote)
+        if job is None:
+            return too_many_requests(5)
+        with span("pdf"):
+            finished = job.wait(INVOICE_SYNC_WAIT)
+        if not finished:
+            if wants_html():
+                return invoice_pending_page(job, token)
+            if not INVOICE_JOB_LINKS:
+                # The job resumes with this instance; a retry joins it or finds the cached PDF
+                return still_rendering()
+            # Too slow to serve inline; the client can poll the job instead
+            return job_accepted(job)
+        if job.error:
+            abort(500)
+        cached = job.result
+    data, etag = cached
+    return invoice_response(data, etag, invoice_filename(quote))
+
+@app.post("/invoice/<token>/render")
+@rate_limited(invoice_limiter)
+def invoice_render_job(token):
+    """Start (or join) a background render and return its job id at once"""
+    if not INVOICE_JOB_LINKS:
+        abort(404)
+    quote = get_quote_by_token(token)
+    if not quote:
+        abort(404)
+    job = invoice_jobs.submit(quote)
+    if job is None:
+        return too_many_requests(5)
+    if job.result is not None:
+        return jsonify(invoice_jobs.describe(job))
+    return job_accepted(job)
+
+@app.route("/invoice/jobs/<job_id>")
+def invoice_job_status(job_id):
+    job = invoice_jobs.get(job_id)
+    if job is None:
+        abort(404)
+    return jsonify(invoice_jobs.describe(job))
+
+@app.route("/invoice/jobs/<job_id>/pdf")
+def invoice_job_download(job_id):
+    job = invoice_jobs.get(job_id)
+    if job is None:
+        abort(404)
+    if job.error:
+        response = jsonify(invoice_jobs.describe(job))
+        response.status_code = 500
+        return response
+    if job.result is None:
+        return job_accepted(job)
+    data, etag = job.result
+    return invoice_response(data, etag, job.filename)
 
 # ===== ADMIN ROUTES =====
 @app.route("/admin/login", methods=["GET", "POST"])
@@ -768,7 +2232,7 @@ def admin_login():
         
         flash("Kredensial salah.", "error")
     
-    return render_template("admin_login.html", t=get_text, lang=get_lang())
+    return render_template("admin_login.html", t=get_catalog(), lang=get_lang())
 
 @app.route("/admin/logout")
 @admin_required
@@ -777,43 +2241,399 @@ def admin_logout():
     flash("Anda sudah logout.", "success")
     return redirect(url_for("admin_login"))
 
+# Dashboard analytics come from server-side aggregations, so their cost does not grow with history
+QUOTE_STATUSES = ['Draft', 'Proposal', 'Approved', 'In Progress', 'Completed']
+INQUIRY_STATUSES = [s.strip() for s in os.environ.get("INQUIRY_STATUSES", "New").split(",") if s.strip()]
+ANALYTICS_WEEKS = int(os.environ.get("ANALYTICS_WEEKS", "8"))
+analytics_cache = TTLCache('dashboard_analytics', maxsize=1, ttl=int(os.environ.get("ANALYTICS_CACHE_TTL", "60")))
+
+def aggregate(query, *specs):
+    """Run ('count'|'sum'|'avg', field) specs as one aggregation query; returns {alias: value}"""
+    aggregation = query
+    for kind, field in specs:
+        alias = f"{kind}_{field}" if field else kind
+        args = (field,) if field else ()
+        aggregation = getattr(aggregation, kind)(*args, alias=alias)
+    return {result.alias: result.value for result in aggregation.get()[0]}
+
+def analytics_loaders(now):
+    """Aggregation queries behind the dashboard analytics, keyed for fetch_concurrently"""
+    inquiries = db.collection('inquiries')
+    quotes = db.collection('quotes')
+    loaders = {('inquiries',): lambda: aggregate(inquiries, ('count', None), ('sum', 'budget'), ('avg', 'budget'))}
+    for status in INQUIRY_STATUSES:
+        query = inquiries.where('status', '==', status)
+        loaders[('inquiry_status', status)] = lambda query=query: aggregate(query, ('count', None))
+    week_start = (now - timedelta(days=now.weekday())).replace(hour=0, minute=0, second=0, microsecond=0)
+    for weeks_ago in range(ANALYTICS_WEEKS):
+        start = week_start - timedelta(weeks=weeks_ago)
+        query = inquiries.where('created_at', '>=', start).where('created_at', '<', start + timedelta(weeks=1))
+        loaders[('inquiry_week', start.date())] = lambda query=query: aggregate(query, ('count', None))
+    for status in QUOTE_STATUSES:
+        query = quotes.where('status', '==', status)
+        loaders[('quote_status', status)] = lambda query=query: aggregate(query, ('count', None), ('sum', 'amount'))
+    return loaders
+
+def summarize_analytics(results, now):
+    """Shape analytics_loaders results for the dashboard; None if any query failed"""
+    parts = {key: value for key, value in results.items() if isinstance(key, tuple)}
+    if not parts or any(value is None for value in parts.values()):
+        return None
+    inquiries = parts[('inquiries',)]
+    by_status = [(status, parts[('inquiry_status', status)]['count']) for status in INQUIRY_STATUSES]
+    other = inquiries['count'] - sum(count for _, count in by_status)
+    if other > 0:
+        by_status.append(('Lainnya', other))
+    quotes_by_status = [
+        (status, parts[('quote_status', status)]['count'], parts[('quote_status', status)]['sum_amount'] or 0)
+        for status in QUOTE_STATUSES
+    ]
+    return {
+        'inquiry_total': inquiries['count'],
+        'budget_total': inquiries['sum_budget'] or 0,
+        'budget_avg': inquiries['avg_budget'],
+        'inquiries_by_status': by_status,
+        'inquiries_per_week': sorted((key[1], value['count']) for key, value in parts.items() if key[0] == 'inquiry_week'),
+        'quotes_by_status': quotes_by_status,
+        'quote_amount_total': sum(total for _, _, total in quotes_by_status),
+        'generated_at': now,
+    }
+
 @app.route("/admin")
 @admin_required
 def admin_dashboard():
-    # Get recent quotes
-    quotes_ref = db.collection('quotes').order_by('created_at', direction=firestore.Query.DESCENDING).limit(10)
-    quotes = [doc_to_dict(doc) for doc in quotes_ref.stream()]
-    
-    # Get recent inquiries
-    inquiries_ref = db.collection('inquiries').order_by('created_at', direction=firestore.Query.DESCENDING).limit(10)
-    inquiries = [doc_to_dict(doc) for doc in inquiries_ref.stream()]
+    # Recent quotes, recent inquiries and highlights are independent, so fetch them together
+    def load(query, fields):
+        return lambda: query_dicts(query, fields, timeout=DB_QUERY_TIMEOUT)
     
-    # Get highlights
-    highlights_ref = db.collection('highlights').order_by('display_order')
-    highlights = [doc_to_dict(doc) for doc in highlights_ref.stream()]
+    newest_first = firestore.Query.DESCENDING
+    loaders = {
+        'quotes': load(db.collection('quotes').order_by('created_at', direction=newest_first).limit(10), QUOTE_ROW_FIELDS),
+        'inquiries': load(db.collection('inquiries').order_by('created_at', direction=newest_first).limit(10), INQUIRY_ROW_FIELDS),
+        'highlights': load(db.collection('highlights').order_by('display_order'), HIGHLIGHT_ROW_FIELDS),
+    }
+    analytics = analytics_cache.get('dashboard')
+    now = datetime.now(timezone.utc)
+    if analytics is None:
+        loaders.update(analytics_loaders(now))
+    results = fetch_concurrently(loaders)
+    if analytics is None:
+        analytics = summarize_analytics(results, now)
+        if analytics is not None:
+            analytics_cache.set('dashboard', analytics)
+    if any(value is None for value in results.values()):
+        flash("Sebagian data gagal dimuat, coba refresh.", "error")
+    quotes = results['quotes'] or []
+    inquiries = results['inquiries'] or []
+    highlights = results['highlights'] or []
     
     return render_template(
         "admin_dashboard.html",
+        spool_depth=inquiry_spool.depth() if inquiry_spool else 0,
+        analytics=analytics,
         quotes=quotes,
         inquiries=inquiries,
         highlights=highlights,
-        t=get_text,
+        t=get_catalog(),
         lang=get_lang()
     )
 
+ADMIN_QUOTES_PAGE_SIZE = int(os.environ.get("ADMIN_QUOTES_PAGE_SIZE", "25"))
+
+def paginate_quotes(per_page, after=None, before=None):
+    """Keyset page of quotes, newest first.
+
+    after/before are quote ids of the last/first row on the neighbouring
+    page. Returns (quotes, prev_cursor, next_cursor).
+    """
+    quotes_col = db.collection('quotes')
+    cursor_id = before or after
+    cursor = quotes_col.document(cursor_id).get() if cursor_id else None
+    if cursor is not None and not cursor.exists:
+        cursor, before, after = None, None, None
+
+    # Walking backwards is the same keyset query in ascending order
+    direction = firestore.Query.ASCENDING if before else firestore.Query.DESCENDING
+    query = quotes_col.order_by('created_at', direction=direction)
+    if cursor is not None:
+        query = query.start_after(cursor)
+    quotes = query_dicts(query.limit(per_page + 1), QUOTE_ROW_FIELDS)
+    has_more = len(quotes) > per_page
+    quotes = quotes[:per_page]
+    if before:
+        quotes.reverse()
+        has_prev, has_next = has_more, True
+    else:
+        has_prev, has_next = bool(after), has_more
+
+    prev_cursor = quotes[0]['id'] if quotes and has_prev else None
+    next_cursor = quotes[-1]['id'] if quotes and has_next else None
+    return quotes, prev_cursor, next_cursor
+
+def count_quotes():
+    """Total number of quotes from a server-side aggregation query"""
+    result = db.collection('quotes').count().get()
+    return result[0][0].value
+
 @app.route("/admin/quotes")
 @admin_required
 def admin_quotes():
-    quotes_ref = db.collection('quotes').order_by('created_at', direction=firestore.Query.DESCENDING)
-    quotes = [doc_to_dict(doc) for doc in quotes_ref.stream()]
-    return render_template("admin_quotes.html", quotes=quotes, t=get_text, lang=get_lang())
+    per_page = min(max(request.args.get("per_page", ADMIN_QUOTES_PAGE_SIZE, type=int), 1), 100)
+    after = request.args.get("after")
+    before = request.args.get("before")
+    results = fetch_concurrently({
+        'page': lambda: paginate_quotes(per_page, after, before),
+        'total': count_quotes,
+    })
+    quotes, prev_cursor, next_cursor = results['page'] or ([], None, None)
+    return render_template(
+        "admin_quotes.html",
+        quotes=quotes,
+        total=results['total'],
+        per_page=per_page,
+        prev_cursor=prev_cursor,
+        next_cursor=next_cursor,
+        t=get_catalog(),
+        lang=get_lang()
+    )
+
+# Bulk invoice export
+INVOICE_EXPORT_WORKERS = int(os.environ.get("INVOICE_EXPORT_WORKERS", str(min(4, os.cpu_count() or 1))))
+INVOICE_EXPORT_MAX_MERGED = int(os.environ.get("INVOICE_EXPORT_MAX_MERGED", "200"))
+
+class _ZipStream(io.RawIOBase):
+    """Write-only sink that lets a ZipFile be drained chunk by chunk"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self):
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+def _parse_date(value):
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc) if value else None
+    except ValueError:
+        return None
+
+def export_quotes_query(status=None, date_from=None, date_to=None):
+    """Quotes filtered by status and created_at date range"""
+    query = db.collection('quotes')
+    if status:
+        query = query.where('status', '==', status)
+    if date_from:
+        query = query.where('created_at', '>=', date_from)
+    if date_to:
+        query = query.where('created_at', '<', date_to + timedelta(days=1))
+    return query
+
+def iter_export_quotes(ids=None, status=None, date_from=None, date_to=None):
+    """Yield quote dicts by id, or by status/created_at filter, one at a time"""
+    if ids:
+        for quote_id in ids:
+            quote = doc_to_dict(db.collection('quotes').document(quote_id).get())
+            if quote:
+                yield quote
+        return
+    query = export_quotes_query(status, date_from, date_to)
+    for doc in query.order_by('created_at', direction=firestore.Query.DESCENDING).stream():
+        yield doc_to_dict(doc)
+
+def count_export_quotes(ids=None, status=None, date_from=None, date_to=None):
+    """How many quotes iter_export_quotes would yield (at most, for ids)"""
+    if ids:
+        return len(ids)
+    return aggregate(export_quotes_query(status, date_from, date_to), ('count', None))['count']
+
+def render_invoices(quotes, generated_at, pool=None):
+    """Yield (quote, pdf_bytes) in order, rendering across pool when given.
+
+    At most two renders per worker are in flight, so memory stays flat
+    however many quotes are exported.
+    """
+    def cached_or_none(quote):
+        hit = invoice_cache.get(invoice_cache_key(quote))
+        return hit[0] if hit else None
+
+    if pool is None:
+        for quote in quotes:
+            yield quote, cached_or_none(quote) or render_invoice_pdf(quote, generated_at)
+        return
+
+    pending = deque()
+    for quote in quotes:
+        data = cached_or_none(quote)
+        pending.append((quote, data if data else pool.submit(render_invoice_pdf, quote, generated_at)))
+        if len(pending) >= INVOICE_EXPORT_WORKERS * 2:
+            quote, result = pending.popleft()
+            yield quote, result if isinstance(result, bytes) else result.result()
+    while pending:
+        quote, result = pending.popleft()
+        yield quote, result if isinstance(result, bytes) else result.result()
+
+@app.route("/admin/invoices/export", methods=["GET", "POST"])
+@admin_required
+def admin_export_invoices():
+    """Download many invoices as a streamed ZIP or one merged PDF"""
+    ids = [i for i in request.values.getlist("ids") if i]
+    status = request.values.get("status", "").strip()
+    date_from = _parse_date(request.values.get("date_from", "").strip())
+    date_to = _parse_date(request.values.get("date_to", "").strip())
+    fmt = request.values.get("format", "zip")
+    quotes = iter_export_quotes(ids, status, date_from, date_to)
+    generated_at = datetime.now(timezone.utc)
+    stamp = generated_at.strftime("%Y%m%d-%H%M")
+
+    if fmt == "pdf":
+        # One canvas for every quote; ReportLab keeps the pages until save(),
+        # so a merged PDF is capped instead of silently truncated
+        if count_export_quotes(ids, status, date_from, date_to) > INVOICE_EXPORT_MAX_MERGED:
+            flash(
+                f"Merged PDF maksimal {INVOICE_EXPORT_MAX_MERGED} proposal; "
+                "persempit filter atau gunakan format ZIP.", "error")
+            return redirect(request.referrer or url_for("admin_quotes"))
+
+        from reportlab.pdfgen import canvas
+        from reportlab.lib.pagesizes import A4
+
+        buf = io.BytesIO()
+        pdf = canvas.Canvas(buf, pagesize=A4)
+        count = 0
+        for quote in quotes:
+            draw_invoice(pdf, quote, generated_at)
+            count += 1
+        if not count:
+            flash("Tidak ada proposal untuk diekspor.", "error")
+            return redirect(request.referrer or url_for("admin_quotes"))
+        pdf.save()
+        buf.seek(0)
+        return send_file(buf, mimetype="application/pdf", as_attachment=True, download_name=f"Invoices-{stamp}.pdf")
+
+    # Build the pool before any byte is sent, so a host that cannot start
+    # processes renders inline instead of breaking the ZIP mid-stream
+    pool = new_process_pool(INVOICE_EXPORT_WORKERS) if INVOICE_EXPORT_WORKERS > 1 else None
+
+    def generate():
+        sink = _ZipStream()
+        with zipfile.ZipFile(sink, "w", zipfile.ZIP_STORED) as archive:
+            for index, (quote, data) in enumerate(render_invoices(quotes, generated_at, pool), 1):
+                archive.writestr(f"{index:04d}-{invoice_filename(quote)}", data)
+                yield sink.drain()
+        yield sink.drain()
+
+    response = Response(
+        generate(),
+        mimetype="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="Invoices-{stamp}.zip"'},
+    )
+    if pool is not None:
+        response.call_on_close(lambda: pool.shutdown(cancel_futures=True))
+    return response
+
+# Columns available to the CSV/JSONL export, in output order
+EXPORT_FIELDS = {
+    'inquiries': ['id', 'client_name', 'project_name', 'scope', 'contact', 'budget', 'status', 'created_at'],
+    'quotes': [
+        'id', 'client_name', 'project_name', 'amount', 'status', 'token', 'created_at', 'scope',
+        'technical_approach', 'deliverables', 'timeline', 'tech_stack', 'team_structure', 'assumptions', 'payment_terms',
+    ],
+}
+EXPORT_PAGE_SIZE = int(os.environ.get("EXPORT_PAGE_SIZE", "500"))
+
+def iter_collection_pages(query, fields, page_size=EXPORT_PAGE_SIZE):
+    """Yield lists of dicts from query, newest first, one cursor page at a time"""
+    # created_at drives the cursor, so it is always fetched
+    query = query.select(sorted(set(fields) | {'created_at'})).order_by('created_at', direction=firestore.Query.DESCENDING)
+    cursor = None
+    while True:
+        page_query = query.start_after(cursor) if cursor is not None else query
+        docs = list(page_query.limit(page_size).stream())
+        if not docs:
+            return
+        yield [doc_to_dict(doc) for doc in docs]
+        if len(docs) < page_size:
+            return
+        cursor = docs[-1]
+
+def _export_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return "" if value is None else value
+
+# Public form input must not be evaluated as a formula when the CSV is opened
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+def _csv_cell(value):
+    value = _export_value(value)
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+@app.route("/admin/export/<collection>")
+@admin_required
+def admin_export(collection):
+    """Stream inquiries or quotes as CSV or JSONL, filtered by status, date and fields"""
+    if collection not in EXPORT_FIELDS:
+        abort(404)
+    fmt = request.args.get("format", "csv")
+    if fmt not in ("csv", "jsonl"):
+        abort(404)
+    available = EXPORT_FIELDS[collection]
+    requested = [f.strip() for f in ",".join(request.args.getlist("fields")).split(",") if f.strip()]
+    fields = [f for f in available if f in requested] or available
+    status = request.args.get("status", "").strip()
+    date_from = _parse_date(request.args.get("date_from", "").strip())
+    date_to = _parse_date(request.args.get("date_to", "").strip())
+
+    query = db.collection(collection)
+    if status:
+        query = query.where('status', '==', status)
+    if date_from:
+        query = query.where('created_at', '>=', date_from)
+    if date_to:
+        query = query.where('created_at', '<', date_to + timedelta(days=1))
+    stored_fields = [f for f in fields if f != 'id']
+
+    def generate():
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        if fmt == "csv":
+            writer.writerow(fields)
+        # One chunk per page: memory is bounded by EXPORT_PAGE_SIZE, not the collection
+        for page in iter_collection_pages(query, stored_fields):
+            for row in page:
+                if fmt == "csv":
+                    writer.writerow([_csv_cell(row.get(f)) for f in fields])
+                else:
+                    buf.write(json.dumps({f: row.get(f) for f in fields}, default=_export_value, ensure_ascii=False) + "\n")
+            yield buf.getvalue().encode("utf-8")
+            buf.seek(0)
+            buf.truncate()
+        if buf.tell():
+            yield buf.getvalue().encode("utf-8")
+
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M")
+    return Response(
+        generate(),
+        mimetype="text/csv" if fmt == "csv" else "application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{collection}-{stamp}.{fmt}"'},
+    )
 
 @app.route("/admin/quotes/new", methods=["GET", "POST"])
 @admin_required
 def admin_new_quote():
     if request.method == "POST":
         return _save_quote(None)
-    return render_template("admin_quote_form.html", quote=None, t=get_text, lang=get_lang())
+    return render_template("admin_quote_form.html", quote=None, t=get_catalog(), lang=get_lang())
 
 @app.route("/admin/quotes/<quote_id>/edit", methods=["GET", "POST"])
 @admin_required
@@ -829,42 +2649,45 @@ def admin_edit_quote(quote_id):
         return _save_quote(quote_id)
     
     quote = doc_to_dict(quote_doc)
-    return render_template("admin_quote_form.html", quote=quote, t=get_text, lang=get_lang())
+    return render_template("admin_quote_form.html", quote=quote, t=get_catalog(), lang=get_lang())
 
 @app.post("/admin/quotes/<quote_id>/delete")
 @admin_required
 def admin_delete_quote(quote_id):
     quote_ref = db.collection('quotes').document(quote_id)
-    quote_ref.delete()
+    quote = doc_to_dict(quote_ref.get())
+    batch = db.batch()
+    batch.delete(quote_ref)
+    if quote and quote.get('token'):
+        batch.delete(db.collection('quote_tokens').document(quote['token']))
+    batch.commit()
+    home_cache.invalidate()
+    token_cache.invalidate()
+    purge_pages(quote_id)
+    analytics_cache.invalidate()
+    search_index.remove('quote', quote_id)
     flash("Quotation dihapus.", "success")
     return redirect(url_for("admin_dashboard"))
 
-def _save_quote(quote_id=None):
-    """Helper to save quote (create or update)"""
-    client_name = request.form.get("client_name", "").strip()
-    project_name = request.form.get("project_name", "").strip()
-    scope = request.form.get("scope", "").strip()
-    amount_str = request.form.get("amount", "").strip()
-    status = request.form.get("status", "Draft").strip() or "Draft"
-    
-    # Proposal fields
-    technical_approach = request.form.get("technical_approach", "").strip()
-    deliverables = request.form.get("deliverables", "").strip()
-    timeline = request.form.get("timeline", "").strip()
-    tech_stack = request.form.get("tech_stack", "").strip()
-    team_structure = request.form.get("team_structure", "").strip()
-    assumptions = request.form.get("assumptions", "").strip()
-    payment_terms = request.form.get("payment_terms", "").strip()
+def _form_value(values, name, default=""):
+    value = values.get(name)
+    return default if value is None else str(value).strip()
+
+def parse_quote_fields(values):
+    """Validate quote fields from a form or import row; returns (quote_data, error)"""
+    client_name = _form_value(values, "client_name")
+    project_name = _form_value(values, "project_name")
+    scope = _form_value(values, "scope")
+    amount_str = _form_value(values, "amount")
+    status = _form_value(values, "status", "Draft") or "Draft"
     
     if not all([client_name, project_name, scope, amount_str]):
-        flash("Field wajib: Client, Project, Scope, Amount.", "error")
-        return redirect(request.referrer or url_for("admin_dashboard"))
+        return None, "Field wajib: Client, Project, Scope, Amount."
     
     try:
         amount = float(amount_str.replace(",", ""))
     except ValueError:
-        flash("Nominal tidak valid.", "error")
-        return redirect(request.referrer or url_for("admin_dashboard"))
+        return None, "Nominal tidak valid."
     
     quote_data = {
         'client_name': client_name,
@@ -872,36 +2695,110 @@ def _save_quote(quote_id=None):
         'scope': scope,
         'amount': amount,
         'status': status,
-        'technical_approach': technical_approach,
-        'deliverables': deliverables,
-        'timeline': timeline,
-        'tech_stack': tech_stack,
-        'team_structure': team_structure,
-        'assumptions': assumptions,
-        'payment_terms': payment_terms,
     }
+    # Proposal fields
+    for field in ('technical_approach', 'deliverables', 'timeline', 'tech_stack',
+                  'team_structure', 'assumptions', 'payment_terms'):
+        quote_data[field] = _form_value(values, field)
+    return quote_data, None
+
+def _save_quote(quote_id=None):
+    """Helper to save quote (create or update)"""
+    quote_data, error = parse_quote_fields(request.form)
+    if error:
+        flash(error, "error")
+        return redirect(request.referrer or url_for("admin_dashboard"))
     
     if quote_id:
         # Update existing
         quote_ref = db.collection('quotes').document(quote_id)
         quote_ref.update(quote_data)
+        search_index.add('quote', quote_id, quote_data)
         flash("Proposal berhasil disimpan!", "success")
     else:
         # Create new
         quote_data['token'] = generate_token()
         quote_data['created_at'] = firestore.SERVER_TIMESTAMP
-        db.collection('quotes').add(quote_data)
+        # Quote and its token mapping are committed together
+        quote_ref = db.collection('quotes').document()
+        batch = db.batch()
+        batch.set(quote_ref, quote_data)
+        batch.set(db.collection('quote_tokens').document(quote_data['token']), {'quote_id': quote_ref.id})
+        batch.commit()
+        search_index.add('quote', quote_ref.id, dict(quote_data, created_at=datetime.now(timezone.utc)))
         flash("Proposal berhasil disimpan! Link & QR code siap di-share.", "success")
     
+    home_cache.invalidate()
+    token_cache.invalidate()
+    purge_pages(quote_id)
+    analytics_cache.invalidate()
     return redirect(url_for("admin_dashboard"))
 
+@app.route("/admin/cache")
+@admin_required
+def admin_cache_stats():
+    """Hit/miss counters for the in-process caches"""
+    return jsonify({name: cache.stats() for name, cache in TTLCache.registry.items()})
+
+@app.route("/admin/search")
+@admin_required
+def admin_search():
+    """Ranked full-text search over proposals and inquiries"""
+    query = request.args.get("q", "").strip()
+    results, elapsed_ms = [], None
+    if query:
+        started = time.perf_counter()
+        try:
+            with span("search"):
+                results = search_index.search(query, limit=SEARCH_RESULT_LIMIT)
+        except Exception:
+            flash("Indeks pencarian gagal dimuat, coba lagi.", "error")
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+    return render_template(
+        "admin_search.html",
+        query=query,
+        results=results,
+        elapsed_ms=elapsed_ms,
+        index=search_index.stats(),
+        t=get_catalog(),
+        lang=get_lang()
+    )
+
+@app.route("/admin/inquiry-spool")
+@admin_required
+def admin_inquiry_spool():
+    """Backlog of inquiries not yet written to Firestore"""
+    if not inquiry_spool:
+        return jsonify({'enabled': False})
+    return jsonify(dict(inquiry_spool.stats(), enabled=True))
+
+@app.route("/admin/mirror")
+@admin_required
+def admin_mirror():
+    """Listener state and staleness of the live collection mirrors"""
+    if not CollectionMirror.registry:
+        return jsonify({'enabled': False})
+    return jsonify(dict(
+        {name: mirror.stats() for name, mirror in CollectionMirror.registry.items()},
+        enabled=True,
+    ))
+
+@app.route("/admin/metrics")
+def admin_metrics():
+    """Prometheus metrics; admin session or 'Authorization: Bearer $METRICS_TOKEN'"""
+    bearer = request.headers.get("Authorization", "")
+    token_ok = bool(METRICS_TOKEN) and secrets.compare_digest(bearer, f"Bearer {METRICS_TOKEN}")
+    if not (session.get("admin_auth") or token_ok):
+        abort(403)
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
 # ===== HIGHLIGHTS ROUTES =====
 @app.route("/admin/highlights/new", methods=["GET", "POST"])
 @admin_required
 def admin_new_highlight():
     if request.method == "POST":
         return _save_highlight(None)
-    return render_template("admin_highlight_form.html", highlight=None, t=get_text, lang=get_lang())
+    return render_template("admin_highlight_form.html", highlight=None, t=get_catalog(), lang=get_lang())
 
 @app.route("/admin/highlights/<highlight_id>/edit", methods=["GET", "POST"])
 @admin_required
@@ -917,38 +2814,46 @@ def admin_edit_highlight(highlight_id):
         return _save_highlight(highlight_id)
     
     highlight = doc_to_dict(highlight_doc)
-    return render_template("admin_highlight_form.html", highlight=highlight, t=get_text, lang=get_lang())
+    return render_template("admin_highlight_form.html", highlight=highlight, t=get_catalog(), lang=get_lang())
 
 @app.post("/admin/highlights/<highlight_id>/delete")
 @admin_required
 def admin_delete_highlight(highlight_id):
     highlight_ref = db.collection('highlights').document(highlight_id)
     highlight_ref.delete()
+    home_cache.invalidate()
+    purge_pages()
     flash("Highlight dihapus.", "success")
     return redirect(url_for("admin_dashboard"))
 
-def _save_highlight(highlight_id=None):
-    """Helper to save highlight (create or update)"""
-    category = request.form.get("category", "").strip() or "General"
-    title = request.form.get("title", "").strip()
-    body = request.form.get("body", "").strip()
-    display_order_str = request.form.get("display_order", "0").strip()
+def parse_highlight_fields(values):
+    """Validate highlight fields from a form or import row; returns (highlight_data, error)"""
+    category = _form_value(values, "category") or "General"
+    title = _form_value(values, "title")
+    body = _form_value(values, "body")
+    display_order_str = _form_value(values, "display_order", "0")
     
     if not all([title, body]):
-        flash("Title dan deskripsi wajib diisi.", "error")
-        return redirect(request.referrer or url_for("admin_dashboard"))
+        return None, "Title dan deskripsi wajib diisi."
     
     try:
         display_order = int(display_order_str or "0")
     except ValueError:
         display_order = 0
     
-    highlight_data = {
+    return {
         'category': category,
         'title': title,
         'body': body,
         'display_order': display_order
-    }
+    }, None
+
+def _save_highlight(highlight_id=None):
+    """Helper to save highlight (create or update)"""
+    highlight_data, error = parse_highlight_fields(request.form)
+    if error:
+        flash(error, "error")
+        return redirect(request.referrer or url_for("admin_dashboard"))
     
     if highlight_id:
         # Update existing
@@ -961,11 +2866,219 @@ def _save_highlight(highlight_id=None):
         db.collection('highlights').add(highlight_data)
         flash("Highlight tersimpan.", "success")
     
+    home_cache.invalidate()
+    purge_pages()
     return redirect(url_for("admin_dashboard"))
 
+# ===== BULK IMPORT =====
+IMPORT_BATCH_WRITES = 500  # Firestore's limit per WriteBatch
+IMPORT_PARSERS = {'quotes': parse_quote_fields, 'highlights': parse_highlight_fields}
+
+def read_import_rows(stream, filename):
+    """Rows of an uploaded .csv or .json file as a list of dicts"""
+    text = stream.read()
+    if isinstance(text, bytes):
+        text = text.decode("utf-8-sig")
+    if filename.lower().endswith(".json"):
+        rows = json.loads(text)
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise ValueError("JSON harus berupa array of objects.")
+        return rows
+    if filename.lower().endswith(".csv"):
+        return list(csv.DictReader(io.StringIO(text)))
+    raise ValueError("Format file harus .csv atau .json.")
+
+def import_records(kind, rows):
+    """Validate and create quotes or highlights in chunked batches.
+
+    Invalid rows are skipped and reported as (row number, message); returns
+    (created, errors).
+    """
+    parse = IMPORT_PARSERS[kind]
+    collection = db.collection(kind)
+    created, errors = [], []
+    batch, pending = db.batch(), 0
+    for number, row in enumerate(rows, 1):
+        data, error = parse(row)
+        if not error and row.get('created_at'):
+            # Legacy records keep their original date
+            try:
+                data['created_at'] = datetime.fromisoformat(str(row['created_at']).strip())
+            except ValueError:
+                error = "created_at harus berformat ISO (YYYY-MM-DD)."
+            else:
+                if data['created_at'].tzinfo is None:
+                    data['created_at'] = data['created_at'].replace(tzinfo=timezone.utc)
+        if error:
+            errors.append((number, error))
+            continue
+        data.setdefault('created_at', firestore.SERVER_TIMESTAMP)
+        ref = collection.document()
+        if kind == 'quotes':
+            data['token'] = generate_token()
+            batch.set(db.collection('quote_tokens').document(data['token']), {'quote_id': ref.id})
+            pending += 1
+        batch.set(ref, data)
+        pending += 1
+        created.append((ref.id, data))
+        # A quote takes two writes, so leave room for the next one
+        if pending > IMPORT_BATCH_WRITES - 2:
+            batch.commit()
+            batch, pending = db.batch(), 0
+    if pending:
+        batch.commit()
+
+    home_cache.invalidate()
+    purge_pages()
+    if kind == 'quotes':
+        token_cache.invalidate()
+        analytics_cache.invalidate()
+        now = datetime.now(timezone.utc)
+        for quote_id, data in created:
+            created_at = data['created_at'] if isinstance(data['created_at'], datetime) else now
+            search_index.add('quote', quote_id, dict(data, created_at=created_at))
+    return len(created), errors
+
+@app.route("/admin/import", methods=["GET", "POST"])
+@admin_required
+def admin_import():
+    """Bulk-create quotes or highlights from an uploaded CSV or JSON file"""
+    kind = request.values.get("kind", "quotes")
+    if kind not in IMPORT_PARSERS:
+        abort(404)
+    result = None
+    if request.method == "POST":
+        upload = request.files.get("file")
+        if not upload or not upload.filename:
+            flash("Pilih file CSV atau JSON.", "error")
+            return redirect(url_for("admin_import", kind=kind))
+        try:
+            rows = read_import_rows(upload.stream, upload.filename)
+        except (ValueError, UnicodeDecodeError) as e:
+            flash(f"File tidak bisa dibaca: {e}", "error")
+            return redirect(url_for("admin_import", kind=kind))
+        started = time.perf_counter()
+        created, errors = import_records(kind, rows)
+        result = {
+            'total': len(rows),
+            'created': created,
+            'errors': errors,
+            'seconds': round(time.perf_counter() - started, 2),
+        }
+        flash(f"{created} dari {len(rows)} baris diimpor.", "success" if not errors else "error")
+    return render_template("admin_import.html", kind=kind, result=result, t=get_catalog(), lang=get_lang())
+
+# ===== CLI COMMANDS =====
+_CSS_STRING = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')""")
+
+def minify_css(text):
+    """Drop comments and redundant whitespace, leaving quoted strings untouched"""
+    text = re.sub(r"/\*.*?\*/", "", text, flags=re.S)
+    parts = _CSS_STRING.split(text)
+    for i in range(0, len(parts), 2):
+        part = re.sub(r"\s+", " ", parts[i])
+        part = re.sub(r"\s*([{};,>])\s*", r"\1", part)
+        parts[i] = re.sub(r":\s+", ":", part).replace(";}", "}")
+    return "".join(parts).strip()
+
+def minify_js(text):
+    """Conservative line-level minification: strip indentation, blank lines and
+    whole-line // comments, keeping line breaks so automatic semicolons still apply"""
+    lines = []
+    in_template = False
+    for line in text.splitlines():
+        if in_template:
+            lines.append(line)
+        else:
+            stripped = line.strip()
+            if stripped and not stripped.startswith("//"):
+                lines.append(stripped)
+        if line.count("`") % 2:
+            in_template = not in_template
+    return "\n".join(lines) + "\n"
+
+@app.cli.command("build-assets")
+def build_assets():
+    """Minify, fingerprint and precompress static assets into static/dist"""
+    if brotli is None:
+        print("brotli not installed; writing .gz variants only.")
+    minifiers = {".css": minify_css, ".js": minify_js}
+    dist_root = os.path.join(app.static_folder, ASSET_DIST_DIR)
+    manifest = {}
+    for source in ASSET_SOURCES:
+        with open(os.path.join(app.static_folder, source), "rb") as f:
+            raw = f.read()
+        stem, ext = os.path.splitext(source)
+        data = minifiers[ext](raw.decode("utf-8")).encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        built = f"{ASSET_DIST_DIR}/{stem}.{digest}{ext}"
+        path = os.path.join(app.static_folder, built)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+        encodings = ["gzip"]
+        with open(path + ".gz", "wb") as f:
+            f.write(gzip.compress(data, compresslevel=9, mtime=0))
+        if brotli:
+            with open(path + ".br", "wb") as f:
+                f.write(brotli.compress(data, quality=11))
+            encodings.insert(0, "br")
+        manifest[source] = {
+            "file": built,
+            "source_sha256": hashlib.sha256(raw).hexdigest(),
+            "encodings": encodings,
+        }
+        print(f"{source}: {len(raw)} -> {len(data)} bytes as {built}")
+    os.makedirs(dist_root, exist_ok=True)
+    with open(ASSET_MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, indent=2)
+    print(f"Wrote {ASSET_MANIFEST_PATH}.")
+
+@app.cli.command("compile-templates")
+def compile_templates():
+    """Compile every template into the Jinja bytecode cache ahead of time"""
+    names = app.jinja_env.list_templates(extensions=["html"])
+    for name in names:
+        app.jinja_env.get_template(name)
+    print(f"Compiled {len(names)} templates into {app.jinja_env.bytecode_cache.directory}.")
+
+@app.cli.command("backfill-quote-tokens")
+def backfill_quote_tokens():
+    """Write quote_tokens/{token} mappings for quotes created before they existed"""
+    batch = db.batch()
+    pending = written = 0
+    for doc in db.collection('quotes').select(['token']).stream():
+        token = (doc.to_dict() or {}).get('token')
+        if not token:
+            continue
+        batch.set(db.collection('quote_tokens').document(token), {'quote_id': doc.id})
+        pending += 1
+        if pending == 500:
+            batch.commit()
+            written += pending
+            batch, pending = db.batch(), 0
+    if pending:
+        batch.commit()
+        written += pending
+    token_cache.invalidate()
+    print(f"Backfilled {written} token mappings.")
+
+@app.cli.command("import-records")
+@click.argument("kind", type=click.Choice(sorted(IMPORT_PARSERS)))
+@click.argument("path", type=click.Path(exists=True, dir_okay=False))
+def import_records_command(kind, path):
+    """Bulk-create quotes or highlights from a CSV or JSON file"""
+    with open(path, "rb") as f:
+        rows = read_import_rows(f, path)
+    started = time.perf_counter()
+    created, errors = import_records(kind, rows)
+    for number, error in errors:
+        print(f"row {number}: {error}")
+    print(f"Imported {created} of {len(rows)} {kind} in {time.perf_counter() - started:.1f}s.")
+
 @app.errorhandler(404)
 def not_found(_):
-    return render_template("404.html", t=get_text, lang=get_lang()), 404
+    return render_template("404.html", t=get_catalog(), lang=get_lang()), 404
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", "5050"))
@@ -0,0 +1,106 @@
+"""Cold-start benchmark: import-to-first-response time of app.py.
+
+Each run starts a fresh interpreter, imports ``app`` and serves one request
+through the Flask test client, mimicking a serverless cold start. Firebase
+is swapped for an empty in-memory client at import time, so no credentials
+or network are needed and only import/initialisation cost is measured.
+
+Compare two commits by pointing --repo at a checkout of each:
+
+    git worktree add /tmp/before <rev>
+    python benchmarks/cold_start.py --repo /tmp/before > before.json
+    python benchmarks/cold_start.py > after.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs inside the child interpreter. Firebase modules are patched right after
+# they are imported (if the app imports them at all), so their import cost
+# still counts towards the measurement.
+CHILD = r'''
+import importlib.abc, importlib.machinery, json, sys, time
+
+class _Empty:
+    def __getattr__(self, name):
+        return lambda *a, **k: self
+    def stream(self, *a, **k):
+        return iter(())
+
+PATCHES = {
+    "firebase_admin": lambda m: setattr(m, "initialize_app", lambda *a, **k: None),
+    "firebase_admin.credentials": lambda m: setattr(m, "Certificate", lambda *a, **k: None),
+    "firebase_admin.firestore": lambda m: setattr(m, "client", lambda *a, **k: _Empty()),
+}
+
+class _PatchFinder(importlib.abc.MetaPathFinder):
+    def find_spec(self, name, path, target=None):
+        if name not in PATCHES:
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(name, path)
+        exec_module = spec.loader.exec_module
+        def patched(module):
+            exec_module(module)
+            PATCHES[name](module)
+        spec.loader.exec_module = patched
+        return spec
+
+sys.meta_path.insert(0, _PatchFinder())
+start = time.perf_counter()
+import app as appmod
+imported = time.perf_counter()
+response = appmod.app.test_client().get(sys.argv[1])
+done = time.perf_counter()
+heavy = ("firebase_admin", "google.cloud.firestore", "reportlab", "qrcode", "PIL")
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "first_response_ms": (done - imported) * 1000,
+    "total_ms": (done - start) * 1000,
+    "status": response.status_code,
+    "loaded": [name for name in heavy if name in sys.modules],
+}))
+'''
+
+
+def run_once(repo, path):
+    env = dict(os.environ, FIREBASE_CREDENTIALS="{}", PYTHONDONTWRITEBYTECODE="1")
+    started = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD, path],
+        cwd=repo, env=env, capture_output=True, text=True, check=True,
+    )
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    result["process_ms"] = (time.perf_counter() - started) * 1000
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repo", default=REPO_ROOT, help="checkout containing app.py")
+    parser.add_argument("--path", default="/", help="route requested after import")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    runs = [run_once(args.repo, args.path) for _ in range(args.runs)]
+    keys = ("import_ms", "first_response_ms", "total_ms", "process_ms")
+    summary = {
+        "repo": os.path.abspath(args.repo),
+        "path": args.path,
+        "runs": args.runs,
+        "status": runs[-1]["status"],
+        "loaded_modules": runs[-1]["loaded"],
+        "median": {key: round(statistics.median(r[key] for r in runs), 2) for key in keys},
+        "min": {key: round(min(r[key] for r in runs), 2) for key in keys},
+    }
+    json.dump(summary, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""In-memory stand-in for the subset of the Firestore client used by app.py.
+
+Supports collection/document references, where/order_by/limit/select/
+start_after queries, stream/get, add/set/update/delete, write batches,
+count/sum/avg aggregations, SERVER_TIMESTAMP and Increment transforms.
+An optional per-call latency simulates the network round trip.
+"""
+import copy
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+
+from google.cloud.firestore_v1 import SERVER_TIMESTAMP
+from google.cloud.firestore_v1.transforms import Increment
+
+_OPERATORS = {
+    "==": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+    "<": lambda a, b: a is not None and a < b,
+    "<=": lambda a, b: a is not None and a <= b,
+    ">": lambda a, b: a is not None and a > b,
+    ">=": lambda a, b: a is not None and a >= b,
+    "in": lambda a, b: a in b,
+    "array_contains": lambda a, b: isinstance(a, list) and b in a,
+}
+
+
+class FakeSnapshot:
+    def __init__(self, reference, data):
+        self.reference = reference
+        self.id = reference.id
+        self._data = data
+
+    @property
+    def exists(self):
+        return self._data is not None
+
+    def to_dict(self):
+        return copy.deepcopy(self._data)
+
+    def get(self, field):
+        return (self._data or {}).get(field)
+
+
+class FakeDocument:
+    def __init__(self, client, collection, doc_id):
+        self._client = client
+        self._collection = collection
+        self.id = doc_id
+
+    @property
+    def path(self):
+        return f"{self._collection}/{self.id}"
+
+    def get(self, **kwargs):
+        self._client._round_trip()
+        with self._client._lock:
+            data = self._client._docs(self._collection).get(self.id)
+            return FakeSnapshot(self, copy.deepcopy(data))
+
+    def set(self, data, merge=False):
+        self._client._round_trip()
+        self._write(data, merge=merge)
+
+    def create(self, data):
+        self.set(data)
+
+    def update(self, data):
+        self._client._round_trip()
+        with self._client._lock:
+            if self.id not in self._client._docs(self._collection):
+                raise KeyError(f"No document to update: {self.path}")
+        self._write(data, merge=True)
+
+    def delete(self):
+        self._client._round_trip()
+        with self._client._lock:
+            self._client._docs(self._collection).pop(self.id, None)
+
+    def _write(self, data, merge):
+        with self._client._lock:
+            docs = self._client._docs(self._collection)
+            current = dict(docs.get(self.id) or {}) if merge else {}
+            for key, value in data.items():
+                if value is SERVER_TIMESTAMP:
+                    value = datetime.now(timezone.utc)
+                elif isinstance(value, Increment):
+                    value = (current.get(key) or 0) + value.value
+                current[key] = copy.deepcopy(value)
+            docs[self.id] = current
+
+
+class FakeAggregationResult:
+    def __init__(self, alias, value):
+        self.alias = alias
+        self.value = value
+
+
+class FakeAggregationQuery:
+    def __init__(self, query):
+        self._query = query
+        self._parts = []
+
+    def count(self, alias=None):
+        self._parts.append(("count", None, alias or "count"))
+        return self
+
+    def sum(self, field, alias=None):
+        self._parts.append(("sum", field, alias or "sum"))
+        return self
+
+    def avg(self, field, alias=None):
+        self._parts.append(("avg", field, alias or "avg"))
+        return self
+
+    def get(self, **kwargs):
+        self._query._client._round_trip()
+        rows = [data for _, data in self._query._matching()]
+        results = []
+        for kind, field, alias in self._parts:
+            if kind == "count":
+                value = len(rows)
+            else:
+                values = [r[field] for r in rows if isinstance(r.get(field), (int, float))]
+                if kind == "sum":
+                    value = sum(values)
+                else:
+                    value = sum(values) / len(values) if values else None
+            results.append(FakeAggregationResult(alias, value))
+        return [results]
+
+    def stream(self, **kwargs):
+        return iter(self.get())
+
+
+class FakeQuery:
+    ASCENDING = "ASCENDING"
+    DESCENDING = "DESCENDING"
+
+    def __init__(self, client, collection, filters=(), orders=(), limit=None, cursor=None, fields=None):
+        self._client = client
+        self._collection = collection
+        self._filters = tuple(filters)
+        self._orders = tuple(orders)
+        self._limit = limit
+        self._cursor = cursor
+        self._fields = fields
+
+    def _copy(self, **changes):
+        state = dict(
+            filters=self._filters, orders=self._orders, limit=self._limit,
+            cursor=self._cursor, fields=self._fields,
+        )
+        state.update(changes)
+        return FakeQuery(self._client, self._collection, **state)
+
+    def where(self, field_path=None, op_string=None, value=None, filter=None):
+        if filter is not None:
+            field_path, op_string, value = filter.field_path, filter.op_string, filter.value
+        return self._copy(filters=self._filters + ((field_path, op_string, value),))
+
+    def order_by(self, field_path, direction=ASCENDING):
+        return self._copy(orders=self._orders + ((field_path, direction),))
+
+    def limit(self, count):
+        return self._copy(limit=count)
+
+    def select(self, field_paths):
+        return self._copy(fields=tuple(field_paths))
+
+    def start_after(self, document_fields):
+        return self._copy(cursor=document_fields)
+
+    def count(self, alias=None):
+        return FakeAggregationQuery(self).count(alias)
+
+    def sum(self, field, alias=None):
+        return FakeAggregationQuery(self).sum(field, alias)
+
+    def avg(self, field, alias=None):
+        return FakeAggregationQuery(self).avg(field, alias)
+
+    def _sort_key(self, doc_id, data):
+        return tuple(data.get(field) for field, _ in self._orders) + (doc_id,)
+
+    def _matching(self):
+        with self._client._lock:
+            rows = [(doc_id, copy.deepcopy(data)) for doc_id, data in self._client._docs(self._collection).items()]
+        for field, op, value in self._filters:
+            rows = [(i, d) for i, d in rows if _OPERATORS[op](d.get(field), value)]
+        # Like Firestore, documents missing an order_by field are excluded
+        rows = [(i, d) for i, d in rows if all(field in d for field, _ in self._orders)]
+        descending = bool(self._orders) and self._orders[0][1] == self.DESCENDING
+        rows.sort(key=lambda row: self._sort_key(*row), reverse=descending)
+        if self._cursor is not None:
+            if isinstance(self._cursor, FakeSnapshot):
+                cursor_key = self._sort_key(self._cursor.id, self._cursor._data or {})
+            else:
+                cursor_key = tuple(self._cursor.get(field) for field, _ in self._orders)
+            position = len(cursor_key)
+            if descending:
+                rows = [row for row in rows if self._sort_key(*row)[:position] < cursor_key]
+            else:
+                rows = [row for row in rows if self._sort_key(*row)[:position] > cursor_key]
+        if self._limit is not None:
+            rows = rows[:self._limit]
+        return rows
+
+    def stream(self, **kwargs):
+        self._client._round_trip()
+        for doc_id, data in self._matching():
+            if self._fields is not None:
+                data = {key: value for key, value in data.items() if key in self._fields}
+            yield FakeSnapshot(FakeDocument(self._client, self._collection, doc_id), data)
+
+    def get(self, **kwargs):
+        return list(self.stream(**kwargs))
+
+
+class FakeCollection(FakeQuery):
+    def __init__(self, client, name):
+        super().__init__(client, name)
+        self.id = name
+
+    def document(self, document_id=None):
+        return FakeDocument(self._client, self._collection, document_id or uuid.uuid4().hex[:20])
+
+    def add(self, document_data):
+        ref = self.document()
+        ref.set(document_data)
+        return datetime.now(timezone.utc), ref
+
+
+class FakeWriteBatch:
+    def __init__(self, client):
+        self._client = client
+        self._writes = []
+
+    def set(self, reference, document_data, merge=False):
+        self._writes.append(lambda: reference._write(document_data, merge=merge))
+
+    def create(self, reference, document_data):
+        self.set(reference, document_data)
+
+    def update(self, reference, field_updates):
+        self._writes.append(lambda: reference._write(field_updates, merge=True))
+
+    def delete(self, reference):
+        def delete():
+            with self._client._lock:
+                self._client._docs(reference._collection).pop(reference.id, None)
+        self._writes.append(delete)
+
+    def commit(self):
+        self._client._round_trip()
+        for write in self._writes:
+            write()
+        self._writes = []
+
+
+class FakeFirestore:
+    """Thread-safe in-memory client; latency is slept once per simulated RPC"""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = 0
+        self._data = {}
+        self._lock = threading.RLock()
+
+    def _docs(self, collection):
+        return self._data.setdefault(collection, {})
+
+    def _round_trip(self):
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def collection(self, name):
+        return FakeCollection(self, name)
+
+    def batch(self):
+        return FakeWriteBatch(self)
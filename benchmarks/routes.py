@@ -0,0 +1,256 @@
+"""Offline route benchmark against the in-memory Firestore fake.
+
+Seeds the fake with a configurable number of quotes, highlights and
+inquiries, drives each route through the Flask test client and prints
+p50/p95/p99 latency and throughput as JSON. No credentials or network.
+
+    python benchmarks/routes.py --quotes 500 --requests 200 > bench.json
+    python benchmarks/routes.py --latency-ms 20 --cold-cache
+    python benchmarks/routes.py --compare before.json after.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+# Benchmarks measure the routes themselves, not the abuse limits or spool
+for group in ("INVOICE", "QR", "INQUIRY"):
+    os.environ.setdefault(f"RATE_LIMIT_{group}_PER_IP", "1000000/1")
+    os.environ.setdefault(f"RATE_LIMIT_{group}_GLOBAL", "1000000/1")
+os.environ.setdefault("PDF_MAX_CONCURRENT", "64")
+os.environ.setdefault("INQUIRY_WRITE_BEHIND", "0")
+os.environ.setdefault("JINJA_CACHE_DIR", os.path.join(tempfile.gettempdir(), "prime-projectx-bench-jinja"))
+
+from fake_firestore import FakeFirestore  # noqa: E402
+
+WORDS = (
+    "production tracking dashboard integration quality control line assembly "
+    "realtime analytics sensor workflow approval inventory maintenance report"
+).split()
+STATUSES = ["Draft", "Proposal", "Approved", "In Progress", "Completed"]
+
+
+def paragraph(rng, words):
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def seed(client, quotes, highlights, inquiries, text_words, rng):
+    """Fill the fake with realistic documents; returns the share tokens"""
+    now = datetime.now(timezone.utc)
+    tokens = []
+    for i in range(quotes):
+        token = f"bench{i:06d}"
+        quote_id = f"q{i:06d}"
+        client.collection("quotes").document(quote_id).set({
+            "client_name": f"Client {i}",
+            "project_name": f"Project {paragraph(rng, 3)}",
+            "scope": paragraph(rng, text_words),
+            "amount": float(rng.randint(5, 500) * 1_000_000),
+            "status": rng.choice(STATUSES),
+            "technical_approach": paragraph(rng, text_words),
+            "deliverables": "\n".join(paragraph(rng, 8) for _ in range(10)),
+            "timeline": "\n".join(paragraph(rng, 6) for _ in range(8)),
+            "tech_stack": paragraph(rng, 20),
+            "team_structure": paragraph(rng, 30),
+            "assumptions": paragraph(rng, text_words // 2),
+            "payment_terms": paragraph(rng, 30),
+            "token": token,
+            "created_at": now - timedelta(hours=i),
+        })
+        client.collection("quote_tokens").document(token).set({"quote_id": quote_id})
+        tokens.append(token)
+    for i in range(highlights):
+        client.collection("highlights").document(f"h{i:04d}").set({
+            "category": rng.choice(["AI", "Automation", "Analytics"]),
+            "title": paragraph(rng, 4),
+            "body": paragraph(rng, 40),
+            "display_order": i,
+            "created_at": now - timedelta(days=i),
+        })
+    for i in range(inquiries):
+        client.collection("inquiries").document(f"i{i:06d}").set({
+            "client_name": f"Lead {i}",
+            "project_name": paragraph(rng, 3),
+            "scope": paragraph(rng, text_words),
+            "contact": f"lead{i}@example.com",
+            "budget": float(rng.randint(1, 100) * 1_000_000),
+            "status": "New",
+            "created_at": now - timedelta(minutes=i),
+        })
+    client.calls = 0
+    return tokens
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+def bench_route(appmod, client_factory, path_for, requests, concurrency, cold_cache, fake):
+    """Issue requests to one route; returns latency summary in milliseconds"""
+    def one(i):
+        if cold_cache:
+            for cache in appmod.TTLCache.registry.values():
+                cache.invalidate()
+        client = client_factory()
+        start = time.perf_counter()
+        response = client.get(path_for(i))
+        response.get_data()
+        return (time.perf_counter() - start) * 1000, response.status_code
+
+    one(0)  # warm-up: first-request imports and template compilation
+    calls_before = fake.calls
+    started = time.perf_counter()
+    if concurrency > 1:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(one, range(requests)))
+    else:
+        results = [one(i) for i in range(requests)]
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(ms for ms, _ in results)
+    errors = sum(1 for _, status in results if status >= 400)
+    return {
+        "requests": requests,
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "mean_ms": round(statistics.fmean(latencies), 3),
+        "max_ms": round(latencies[-1], 3),
+        "throughput_rps": round(requests / elapsed, 2) if elapsed else None,
+        "firestore_calls_per_request": round((fake.calls - calls_before) / requests, 3),
+    }
+
+
+def git_revision():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args):
+    rng = random.Random(args.seed)
+    fake = FakeFirestore(latency=args.latency_ms / 1000)
+    tokens = seed(fake, args.quotes, args.highlights, args.inquiries, args.text_words, rng)
+
+    import app as appmod
+    appmod.set_db(fake)
+    appmod.app.config["TESTING"] = True
+
+    def public_client():
+        return appmod.app.test_client()
+
+    def admin_client():
+        client = appmod.app.test_client()
+        with client.session_transaction() as sess:
+            sess["admin_auth"] = True
+        return client
+
+    token_at = lambda i: tokens[i % len(tokens)]  # noqa: E731
+    routes = {
+        "/": (public_client, lambda i: "/"),
+        "/q/<token>": (public_client, lambda i: f"/q/{token_at(i)}"),
+        "/qr/<token>": (public_client, lambda i: f"/qr/{token_at(i)}"),
+        "/invoice/<token>": (public_client, lambda i: f"/invoice/{token_at(i)}"),
+        "/admin": (admin_client, lambda i: "/admin"),
+        "/admin/quotes": (admin_client, lambda i: "/admin/quotes"),
+    }
+    selected = args.routes or list(routes)
+
+    results = {}
+    for name in selected:
+        factory, path_for = routes[name]
+        requests = args.pdf_requests if name == "/invoice/<token>" else args.requests
+        results[name] = bench_route(appmod, factory, path_for, requests, args.concurrency, args.cold_cache, fake)
+        print(f"{name:18s} p50={results[name]['p50_ms']:.2f}ms p95={results[name]['p95_ms']:.2f}ms", file=sys.stderr)
+
+    return {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "config": {
+            "quotes": args.quotes,
+            "highlights": args.highlights,
+            "inquiries": args.inquiries,
+            "text_words": args.text_words,
+            "requests": args.requests,
+            "pdf_requests": args.pdf_requests,
+            "concurrency": args.concurrency,
+            "latency_ms": args.latency_ms,
+            "cold_cache": args.cold_cache,
+            "seed": args.seed,
+        },
+        "routes": results,
+    }
+
+
+def compare(before_path, after_path):
+    """Print per-route p50/p95/p99 change between two result files"""
+    with open(before_path) as f:
+        before = json.load(f)
+    with open(after_path) as f:
+        after = json.load(f)
+    rows = {}
+    for name, stats in after["routes"].items():
+        old = before["routes"].get(name)
+        if not old:
+            continue
+        rows[name] = {
+            key: {
+                "before": old[key],
+                "after": stats[key],
+                "change_pct": round((stats[key] - old[key]) / old[key] * 100, 1) if old[key] else None,
+            }
+            for key in ("p50_ms", "p95_ms", "p99_ms", "throughput_rps")
+        }
+    return {"before": before.get("revision"), "after": after.get("revision"), "routes": rows}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quotes", type=int, default=200)
+    parser.add_argument("--highlights", type=int, default=12)
+    parser.add_argument("--inquiries", type=int, default=200)
+    parser.add_argument("--text-words", type=int, default=150, help="words per long proposal field")
+    parser.add_argument("--requests", type=int, default=200, help="requests per route")
+    parser.add_argument("--pdf-requests", type=int, default=30, help="requests for /invoice/<token>")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="simulated Firestore round trip")
+    parser.add_argument("--cold-cache", action="store_true", help="clear in-process caches before each request")
+    parser.add_argument("--routes", nargs="*", help="subset of routes to run, e.g. / /admin")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="diff two result files")
+    args = parser.parse_args()
+
+    result = compare(*args.compare) if args.compare else run(args)
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()